@@ -7,7 +7,8 @@ https://github.com/moonen-home-automation/hass-bridge-companion
 
 import asyncio
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.config_entries import ConfigEntry
@@ -20,85 +21,184 @@ from homeassistant.helpers.dispatcher import (
 )
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_registry import async_get
+from homeassistant.helpers.importlib import async_import_module
 
 from .const import (
+    ALREADY_DISCOVERED,
+    ATTRIBUTE_SIZE_LIMIT,
+    ATTRIBUTE_STORE,
     BRIDGE_ENTITY_ADD,
     BRIDGE_ENTITY_ADD_UPDATED,
     BRIDGE_ENTITY_AVAILABLE,
     BRIDGE_ENTITY_CONFIG,
+    BRIDGE_ENTITY_OWNER,
     BRIDGE_ENTITY_STATE,
+    CHANGE_ENTITY_TYPE,
+    CONF_ATTRIBUTE_SIZE_LIMIT,
     CONF_ATTRIBUTES,
     CONF_AVAILABLE,
+    CONF_BRIDGE_ID,
     CONF_CONFIG,
+    CONF_CONFIG_HASH,
     CONF_DEVICE_CLASS,
     CONF_DEVICE_INFO,
     CONF_DEVICE_SLUG,
     CONF_ENTITY_CATEGORY,
     CONF_ENTITY_SLUG,
+    CONF_EXPIRE_AFTER,
     CONF_ICON,
     CONF_ID,
     CONF_NAME,
     CONF_OPTIONS,
+    CONF_PLATFORM,
+    CONF_RECONNECT_GRACE,
+    CONF_RECORD_ATTRIBUTES,
     CONF_REMOVE,
     CONF_SERVICE_SLUG,
+    CONF_STATE,
     CONF_TYPE,
     CONF_UNIT_OF_MEASUREMENT,
+    CONF_UNRECORDED_ATTRIBUTES,
     CONF_VERSION,
+    CONFIG_ENTRY_IS_SETUP,
+    CONFIG_POOL,
+    DEFAULT_BRIDGE_ID,
+    DEFAULT_RECONNECT_GRACE,
     DOMAIN,
     DOMAIN_DATA,
+    EXPIRY_SCHEDULER,
+    INVENTORY,
+    LATENCY_TRACKER,
+    OWNERSHIP,
     STARTUP_MESSAGE,
+    TRACE,
+    TRAFFIC_RECORDER,
 )
-from .discovery import (
-    ALREADY_DISCOVERED,
-    CHANGE_ENTITY_TYPE,
-    CONFIG_ENTRY_IS_SETUP,
-    start_discovery,
-    stop_discovery,
+
+# Only the standard library, and the entities need it for every traced update
+from .latency import LatencyTracker, async_finish_trace
+from .util import (
+    BRIDGES,
+    async_get_bridge_data,
+    config_hash,
+    device_identifier,
+    entity_unique_id,
+    entry_bridge_id,
+    message_unique_id,
 )
 from .version import __version__ as VERSION  # noqa: N812
-from .websocket import register_websocket_handlers
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .expiry import ExpiryScheduler
+    from .interning import ConfigPool
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
+    # Imported in the executor on first setup to keep importing the integration cheap
+    attribute_store = await async_import_module(hass, f"{__name__}.attribute_store")
+    backpressure = await async_import_module(hass, f"{__name__}.backpressure")
+    discovery = await async_import_module(hass, f"{__name__}.discovery")
+    expiry = await async_import_module(hass, f"{__name__}.expiry")
+    interning = await async_import_module(hass, f"{__name__}.interning")
+    websocket = await async_import_module(hass, f"{__name__}.websocket")
+
     if hass.data.get(DOMAIN_DATA) is None:
-        hass.data.setdefault(DOMAIN_DATA, {})
+        hass.data.setdefault(DOMAIN_DATA, {BRIDGES: {}})
         _LOGGER.info(STARTUP_MESSAGE)
 
-    register_websocket_handlers(hass)
-    await start_discovery(hass, entry)
-    hass.bus.async_fire(DOMAIN, {CONF_TYPE: "loaded", CONF_VERSION: VERSION})
+        backpressure.start_backpressure(hass)
+        hass.data[DOMAIN_DATA][LATENCY_TRACKER] = LatencyTracker()
+        hass.data[DOMAIN_DATA][EXPIRY_SCHEDULER] = expiry.ExpiryScheduler(hass)
+        hass.data[DOMAIN_DATA][CONFIG_POOL] = interning.ConfigPool()
+        store = attribute_store.AttributeStore(hass)
+        await store.async_load()
+        hass.data[DOMAIN_DATA][ATTRIBUTE_STORE] = store
+        websocket.register_websocket_handlers(hass)
+
+    bridge_id = entry_bridge_id(entry)
+    hass.data[DOMAIN_DATA][BRIDGES][bridge_id] = {}
+    await discovery.start_discovery(hass, entry, bridge_id)
+    hass.bus.async_fire(
+        DOMAIN,
+        {CONF_TYPE: "loaded", CONF_VERSION: VERSION, CONF_BRIDGE_ID: bridge_id},
+    )
 
-    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Handle removal of an entry."""
+    backpressure = await async_import_module(hass, f"{__name__}.backpressure")
+    discovery = await async_import_module(hass, f"{__name__}.discovery")
+
+    bridge_id = entry_bridge_id(entry)
+    bridges = hass.data[DOMAIN_DATA][BRIDGES]
     unloaded = all(
         await asyncio.gather(
             *[
                 hass.config_entries.async_forward_entry_unload(entry, platform)
-                for platform in hass.data[DOMAIN_DATA][CONFIG_ENTRY_IS_SETUP]
+                for platform in bridges[bridge_id][CONFIG_ENTRY_IS_SETUP]
             ]
         )
     )
 
     if unloaded:
-        stop_discovery(hass)
-        hass.data.pop(DOMAIN_DATA)
-        hass.bus.async_fire(DOMAIN, {CONF_TYPE: "unloaded"})
+        discovery.stop_discovery(hass, bridge_id)
+        bridges.pop(bridge_id)
+        if not bridges:
+            backpressure.stop_backpressure(hass)
+            if (recorder := hass.data[DOMAIN_DATA].get(TRAFFIC_RECORDER)) is not None:
+                await recorder.async_stop()
+            hass.data[DOMAIN_DATA][EXPIRY_SCHEDULER].async_stop()
+            hass.data.pop(DOMAIN_DATA)
+        hass.bus.async_fire(DOMAIN, {CONF_TYPE: "unloaded", CONF_BRIDGE_ID: bridge_id})
 
     return unloaded
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Realod config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running bridge, without reloading it."""
+    data = async_get_bridge_data(hass, entry_bridge_id(entry))
+    if data is not None:
+        data[OWNERSHIP].async_set_reconnect_grace(
+            entry.options.get(CONF_RECONNECT_GRACE, DEFAULT_RECONNECT_GRACE)
+        )
+
+
+@callback
+def async_create_entities(
+    hass: HomeAssistant,
+    discovered: list[tuple[dict[str, Any], ActiveConnection]],
+    create: "Callable[[dict[str, Any], ActiveConnection], BridgeEntity]",
+) -> list["BridgeEntity"]:
+    """Create the entities of a discovery batch, skipping invalid configs."""
+    entities = []
+    for config, connection in discovered:
+        unique_id = message_unique_id(config)
+        data = async_get_bridge_data(
+            hass, config.get(CONF_BRIDGE_ID, DEFAULT_BRIDGE_ID)
+        )
+        try:
+            entities.append(create(config, connection))
+        except (AssertionError, KeyError, TypeError, ValueError):
+            _LOGGER.exception("Invalid config for entity %s", unique_id)
+            # Forget the entity, so that the next add creates it again
+            if data is not None:
+                data[ALREADY_DISCOVERED].pop(unique_id, None)
+                data[OWNERSHIP].async_release(unique_id)
+            continue
+
+        # A recreated entity lost its owner when the old entity was removed
+        if data is not None and data[OWNERSHIP].owner(unique_id) is None:
+            data[OWNERSHIP].async_claim(unique_id, connection)
+    return entities
 
 
 class BridgeEntity(Entity):
@@ -107,17 +207,21 @@ class BridgeEntity(Entity):
     _platform: str | None = None
     remove_signal_discovery_update = None
     remove_signal_entity_update = None
+    _remove_signal_owner_update = None
     _bidirectional = False
+    _record_attributes = True
+    _config_unrecorded_attributes: frozenset[str] = frozenset()
 
     def __init__(self, hass: HomeAssistant, config: Any) -> None:
         """Initialize the entity."""
         self.hass = hass
-        self._device_info = config.get(CONF_DEVICE_INFO)
+        self._device_info = self._intern(config.get(CONF_DEVICE_INFO))
+        self._bridge_id = config.get(CONF_BRIDGE_ID, DEFAULT_BRIDGE_ID)
         self._service_slug = config[CONF_SERVICE_SLUG]
         self._device_slug = config[CONF_DEVICE_SLUG]
         self._entity_slug = config[CONF_ENTITY_SLUG]
-        self._attr_unique_id = (
-            f"{DOMAIN}-{self._service_slug}-{self._device_slug}-{self._entity_slug}"
+        self._attr_unique_id = entity_unique_id(
+            self._bridge_id, self._service_slug, self._device_slug, self._entity_slug
         )
         self._attr_should_poll = False
 
@@ -128,7 +232,13 @@ class BridgeEntity(Entity):
         """Return device specific attributes."""
         info = None
         if self._device_info is not None:
-            info = {"identifiers": {(DOMAIN, self._service_slug, self._device_slug)}}
+            info = {
+                "identifiers": {
+                    device_identifier(
+                        self._bridge_id, self._service_slug, self._device_slug
+                    )
+                }
+            }
             info.update(self._device_info)
         return info
 
@@ -150,6 +260,19 @@ class BridgeEntity(Entity):
         self._attr_available = False
         self.async_write_ha_state()
 
+    @callback
+    def handle_owner_update(
+        self, connection: ActiveConnection | None, message_id: int | None
+    ) -> None:
+        """Send commands to the new owner, or become unavailable without one."""
+        if connection is None:
+            self.handle_lost_connection()
+            return
+        self._attr_available = True
+        self._message_id = message_id
+        self._connection = connection
+        self.async_write_ha_state()
+
     @callback
     def handle_discovery_update(
         self, msg: dict[str, Any], connection: ActiveConnection
@@ -162,7 +285,13 @@ class BridgeEntity(Entity):
                 def recreate_entity() -> None:
                     """Create entity with new type."""
                     del msg[CONF_REMOVE]
-                    async_dispatcher_send(self.hass, BRIDGE_ENTITY_ADD, msg, connection)
+                    # The new entity claims the owner again when it is created
+                    async_dispatcher_send(
+                        self.hass,
+                        BRIDGE_ENTITY_ADD.format(self._bridge_id),
+                        msg,
+                        connection,
+                    )
 
                 self.async_on_remove(recreate_entity)
 
@@ -176,9 +305,6 @@ class BridgeEntity(Entity):
                 self._attr_available = True
                 self._message_id = msg[CONF_ID]
                 self._connection = connection
-                self._connection.subscriptions[msg[CONF_ID]] = (
-                    self.handle_lost_connection
-                )
             self._async_write_ha_state()
 
     def entity_category_mapper(self, category: str) -> EntityCategory | None:
@@ -191,7 +317,13 @@ class BridgeEntity(Entity):
 
     def update_discovery_config(self, msg: dict[str, Any]) -> None:
         """Update entity config."""
-        self._config = msg[CONF_CONFIG]
+        data = self.hass.data.get(DOMAIN_DATA)
+        if data is not None:
+            pool: ConfigPool = data[CONFIG_POOL]
+            self._config, self._config_hash = pool.async_intern_config(msg[CONF_CONFIG])
+        else:
+            self._config = msg[CONF_CONFIG]
+            self._config_hash = config_hash(self._config)
         self._attr_icon = self._config.get(CONF_ICON)
         self._attr_name = self._config.get(CONF_NAME)
         self._attr_device_class = self._config.get(CONF_DEVICE_CLASS)
@@ -199,6 +331,54 @@ class BridgeEntity(Entity):
             self._config.get(CONF_ENTITY_CATEGORY)
         )
         self._attr_unit_of_measurement = self._config.get(CONF_UNIT_OF_MEASUREMENT)
+        # Discovery sends the whole config, so absent keys fall back to defaults
+        self.update_unrecorded_attributes(
+            {
+                CONF_UNRECORDED_ATTRIBUTES: (),
+                CONF_RECORD_ATTRIBUTES: True,
+                **self._config,
+            }
+        )
+
+    def _intern(self, value: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Return the instance of a dict shared with the other entities."""
+        data = self.hass.data.get(DOMAIN_DATA)
+        if value is None or data is None:
+            return value
+        return data[CONFIG_POOL].async_intern(value)
+
+    def update_unrecorded_attributes(self, config: dict[str, Any]) -> None:
+        """Exclude attributes from being recorded, for the keys in the config."""
+        if CONF_UNRECORDED_ATTRIBUTES in config:
+            self._config_unrecorded_attributes = frozenset(
+                config[CONF_UNRECORDED_ATTRIBUTES]
+            )
+        if CONF_RECORD_ATTRIBUTES in config:
+            self._record_attributes = config[CONF_RECORD_ATTRIBUTES]
+        self.apply_unrecorded_attributes()
+
+    def apply_unrecorded_attributes(self) -> None:
+        """
+        Apply the unrecorded attributes to the state info of this entity.
+
+        Only extra state attributes are excluded. Attributes of the entity
+        itself, such as friendly_name and unit_of_measurement, are still
+        recorded with record_attributes false.
+        """
+        combined = (
+            self._entity_component_unrecorded_attributes
+            | self._unrecorded_attributes
+            | self._config_unrecorded_attributes
+        )
+        # The recorder has no wildcard, so exclude the current attribute keys
+        if not self._record_attributes and self.extra_state_attributes:
+            combined |= self.extra_state_attributes.keys()
+
+        # The class attributes are combined once per class, the state info is
+        # what the recorder reads per entity. It is set up when the entity is
+        # added, so async_added_to_hass applies the config again.
+        if self._state_info is not None:
+            self._state_info = {**self._state_info, "unrecorded_attributes": combined}
 
     def update_config(self, msg: dict[str, Any]) -> None:
         """Update entity config."""
@@ -210,6 +390,20 @@ class BridgeEntity(Entity):
             self._attr_icon = config.get(CONF_ICON)
         if config.get(CONF_OPTIONS):
             self._attr_options = config.get(CONF_OPTIONS)
+        if CONF_UNRECORDED_ATTRIBUTES in config or CONF_RECORD_ATTRIBUTES in config:
+            self.update_unrecorded_attributes(config)
+
+    def bridge_info(self) -> dict[str, Any]:
+        """Return what the bridge needs to resync this entity."""
+        return {
+            CONF_SERVICE_SLUG: self._service_slug,
+            CONF_DEVICE_SLUG: self._device_slug,
+            CONF_ENTITY_SLUG: self._entity_slug,
+            CONF_PLATFORM: self._platform,
+            CONF_CONFIG_HASH: self._config_hash,
+            CONF_STATE: self.state,
+            CONF_AVAILABLE: self.available,
+        }
 
     def update_discovery_device_info(self, msg: dict[str, Any]) -> None:
         """Update entity device info."""
@@ -220,27 +414,27 @@ class BridgeEntity(Entity):
         entity_id = entity_registry.async_get_entity_id(
             self._platform, DOMAIN, self.unique_id
         )
-        self._device_info = msg.get(CONF_DEVICE_INFO)
+        self._device_info = self._intern(msg.get(CONF_DEVICE_INFO))
 
         # Remove entity from device registry if device info is removed
         if self._device_info is None and entity_id is not None:
             entity_registry.async_update_entity(entity_id, device_id=None)
 
-        # Update device info
-        if self._device_info is not None:
-            device_registry = dr.async_get(self.hass)
-            device_info = self.device_info
-            assert device_info is not None  # noqa: S101
-            identifiers = device_info.pop("identifiers")
-            device = device_registry.async_get_device(identifiers)
+        # Add entity to device, the device itself is updated once per discovery batch
+        if self._device_info is not None and entity_id is not None:
+            device = dr.async_get(self.hass).async_get_device(
+                {
+                    device_identifier(
+                        self._bridge_id, self._service_slug, self._device_slug
+                    )
+                }
+            )
             if device is not None:
-                device_registry.async_update_device(device.id, **device_info)
-                # Add entity to device
-                if entity_id is not None:
-                    entity_registry.async_update_entity(entity_id, device_id=device.id)
+                entity_registry.async_update_entity(entity_id, device_id=device.id)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
+        self.apply_unrecorded_attributes()
         self._remove_signal_discovery_update = async_dispatcher_connect(
             self.hass,
             BRIDGE_ENTITY_ADD_UPDATED.format(self.unique_id),
@@ -248,22 +442,27 @@ class BridgeEntity(Entity):
         )
         self._remove_signal_config_update = async_dispatcher_connect(
             self.hass,
-            BRIDGE_ENTITY_CONFIG.format(
-                self._service_slug, self._device_slug, self._entity_slug
-            ),
+            BRIDGE_ENTITY_CONFIG.format(self.unique_id),
             self.handle_config_update,
         )
         self._remove_signal_availability_update = async_dispatcher_connect(
             self.hass,
-            BRIDGE_ENTITY_AVAILABLE.format(
-                self._service_slug, self._device_slug, self._entity_slug
-            ),
+            BRIDGE_ENTITY_AVAILABLE.format(self.unique_id),
             self.handle_availability_update,
         )
 
+        data = async_get_bridge_data(self.hass, self._bridge_id)
+        if data is not None:
+            data[INVENTORY].async_add(
+                self.unique_id, self._service_slug, self._device_slug, self
+            )
+
         if self._bidirectional:
-            self._connection.subscriptions[self._message_id] = (
-                self.handle_lost_connection
+            # The ownership index tells when the owning connection is lost
+            self._remove_signal_owner_update = async_dispatcher_connect(
+                self.hass,
+                BRIDGE_ENTITY_OWNER.format(self.unique_id),
+                self.handle_owner_update,
             )
 
     async def async_will_remove_from_hass(self) -> None:
@@ -272,10 +471,20 @@ class BridgeEntity(Entity):
             return
         if self._remove_signal_discovery_update is not None:
             self._remove_signal_discovery_update()
+        if self._remove_signal_config_update is not None:
+            self._remove_signal_config_update()
         if self._remove_signal_availability_update is not None:
             self._remove_signal_availability_update()
-
-        del self.hass.data[DOMAIN_DATA][ALREADY_DISCOVERED][self.unique_id]
+        if self._remove_signal_owner_update is not None:
+            self._remove_signal_owner_update()
+
+        data = async_get_bridge_data(self.hass, self._bridge_id)
+        if data is not None:
+            del data[ALREADY_DISCOVERED][self.unique_id]
+            data[OWNERSHIP].async_release(self.unique_id)
+            data[INVENTORY].async_remove(
+                self.unique_id, self._service_slug, self._device_slug
+            )
 
         # Remove the entity_id from the entity registry
         entity_registry = async_get(self.hass)
@@ -290,17 +499,41 @@ class BridgeEntity(Entity):
 class BridgeStateEntity(BridgeEntity):
     """BridgeStateEntity class."""
 
+    _attribute_size_limit = ATTRIBUTE_SIZE_LIMIT
+    _expire_after: float | None = None
+    _expired = False
+    _expiry_ready = False
+
     def __init__(self, hass: HomeAssistant, config: Any) -> None:
         """Initialize BridgeStateEntity."""
         super().__init__(hass, config)
 
         self.update_entity_state_attributes(config)
 
+    @property
+    def available(self) -> bool:
+        """Return if the entity is available and its state has not expired."""
+        return not self._expired and super().available
+
     @callback
     def handle_entity_update(self, msg: dict[str, Any]) -> None:
         """Update entity state."""
+        if self._expire_after is not None:
+            self.async_reset_expiry()
+        self.async_write_entity_update(msg)
+
+    @callback
+    def async_write_entity_update(self, msg: dict[str, Any]) -> None:
+        """Write a state update of the entity."""
+        if TRACE not in msg:
+            self.update_entity_state_attributes(msg)
+            self.async_write_ha_state()
+            return
+
+        started = time.perf_counter()
         self.update_entity_state_attributes(msg)
         self.async_write_ha_state()
+        async_finish_trace(self.hass, self._platform, msg, started)
 
     def update_config(self, msg: dict[str, Any]) -> None:
         """Update entity config."""
@@ -309,9 +542,60 @@ class BridgeStateEntity(BridgeEntity):
         if config.get(CONF_DEVICE_CLASS):
             self._attr_device_class = config.get(CONF_DEVICE_CLASS)
 
+    def update_discovery_config(self, msg: dict[str, Any]) -> None:
+        """Update entity config."""
+        super().update_discovery_config(msg)
+        limit = int(self._config.get(CONF_ATTRIBUTE_SIZE_LIMIT, ATTRIBUTE_SIZE_LIMIT))
+        if limit < 0:
+            error = f"attribute_size_limit must not be negative, got {limit}"
+            raise ValueError(error)
+        expire_after = self._config.get(CONF_EXPIRE_AFTER)
+        expire_after = float(expire_after) if expire_after else None
+        if expire_after is not None and expire_after < 0:
+            error = f"expire_after must not be negative, got {expire_after}"
+            raise ValueError(error)
+
+        self._attribute_size_limit = limit
+        if expire_after != self._expire_after:
+            self._expire_after = expire_after
+            self.async_reset_expiry()
+
     def update_entity_state_attributes(self, msg: dict[str, Any]) -> None:
         """Update entity state attributes."""
-        self._attr_extra_state_attributes = msg.get(CONF_ATTRIBUTES, {})
+        attributes = msg.get(CONF_ATTRIBUTES, {})
+        data = self.hass.data.get(DOMAIN_DATA)
+        if data is not None:
+            # Oversized attributes are replaced by a reference to the side store
+            attributes = data[ATTRIBUTE_STORE].async_offload(
+                self.unique_id,
+                attributes,
+                getattr(self, "_attr_extra_state_attributes", None) or {},
+                self._attribute_size_limit,
+            )
+        self._attr_extra_state_attributes = attributes
+        if not self._record_attributes:
+            self.apply_unrecorded_attributes()
+
+    @callback
+    def async_reset_expiry(self) -> None:
+        """Restart the expiry of the state, or stop it without expire_after."""
+        self._expired = False
+        data = self.hass.data.get(DOMAIN_DATA)
+        if not self._expiry_ready or data is None:
+            return
+        scheduler: ExpiryScheduler = data[EXPIRY_SCHEDULER]
+        if self._expire_after is None:
+            scheduler.async_cancel(self.unique_id)
+        else:
+            scheduler.async_schedule(
+                self.unique_id, self._expire_after, self._async_expire
+            )
+
+    @callback
+    def _async_expire(self) -> None:
+        """Become unavailable when no state update arrived in time."""
+        self._expired = True
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -319,14 +603,22 @@ class BridgeStateEntity(BridgeEntity):
 
         self._remove_signal_entity_update = async_dispatcher_connect(
             self.hass,
-            BRIDGE_ENTITY_STATE.format(
-                self._service_slug, self._device_slug, self._entity_slug
-            ),
+            BRIDGE_ENTITY_STATE.format(self.unique_id),
             self.handle_entity_update,
         )
 
+        self._expiry_ready = True
+        if self._expire_after is not None:
+            self.async_reset_expiry()
+
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
         if self._remove_signal_entity_update is not None:
             self._remove_signal_entity_update()
+        data = self.hass.data.get(DOMAIN_DATA)
+        if data is not None:
+            data[ATTRIBUTE_STORE].async_remove(self.unique_id)
+            if self._expiry_ready:
+                data[EXPIRY_SCHEDULER].async_cancel(self.unique_id)
+        self._expiry_ready = False
         await super().async_will_remove_from_hass()
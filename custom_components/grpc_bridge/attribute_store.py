@@ -0,0 +1,118 @@
+"""Side store for state attributes that are too large for the state machine."""
+
+import hashlib
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+
+from .const import ATTRIBUTE_STORE_SAVE_DELAY, DOMAIN
+
+STORAGE_KEY = f"{DOMAIN}.attributes"
+STORAGE_VERSION = 1
+
+# A character takes at most 6 bytes in JSON, as a \uXXXX escape
+MAX_JSON_BYTES_PER_CHAR = 6
+
+
+class AttributeStore:
+    """
+    Full values of oversized attributes, in memory and on disk.
+
+    The state attributes only keep a reference with the size and digest of
+    the value, so a changed value still changes the state.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, dict[str, dict[str, Any]]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._entities: dict[str, dict[str, dict[str, Any]]] = {}
+
+    async def async_load(self) -> None:
+        """Load the values stored before the last restart."""
+        self._entities = await self._store.async_load() or {}
+
+    def get(self, unique_id: str) -> dict[str, Any]:
+        """Return the stored attribute values of an entity."""
+        return {
+            key: entry["value"]
+            for key, entry in self._entities.get(unique_id, {}).items()
+        }
+
+    @callback
+    def async_offload(
+        self,
+        unique_id: str,
+        attributes: dict[str, Any],
+        previous: dict[str, Any],
+        limit: int,
+    ) -> dict[str, Any]:
+        """
+        Store the attributes over the size limit and return references to them.
+
+        Values are only encoded to measure them when they could be over the
+        limit and changed since the previous update.
+        """
+        stored = self._entities.get(unique_id, {})
+        entries = {}
+        references = {}
+        for key, value in attributes.items():
+            if isinstance(value, str):
+                if len(value) * MAX_JSON_BYTES_PER_CHAR <= limit:
+                    continue
+            elif not isinstance(value, dict | list) or not value:
+                continue
+
+            entry = stored.get(key)
+            if entry is None or value != entry["value"]:
+                if entry is None and key in previous and value == previous[key]:
+                    # Unchanged and under the limit at the previous update
+                    continue
+                encoded = json_bytes(value)
+                if len(encoded) <= limit:
+                    continue
+                digest = hashlib.sha1(encoded, usedforsecurity=False).hexdigest()
+                entry = {"digest": digest, "size": len(encoded), "value": value}
+            entries[key] = entry
+            references[key] = {
+                "stored": True,
+                "size": entry["size"],
+                "digest": entry["digest"],
+            }
+
+        if entries.keys() != stored.keys() or any(
+            entry is not stored[key] for key, entry in entries.items()
+        ):
+            if entries:
+                self._entities[unique_id] = entries
+            else:
+                self._entities.pop(unique_id, None)
+            self._async_schedule_save()
+
+        if not references:
+            return attributes
+        return {**attributes, **references}
+
+    @callback
+    def async_remove(self, unique_id: str) -> None:
+        """Drop the stored attributes of a removed entity."""
+        if self._entities.pop(unique_id, None) is not None:
+            self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Write the store to disk after a delay."""
+        self._store.async_delay_save(self._data_to_save, ATTRIBUTE_STORE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Return a snapshot of the store, taken in the event loop.
+
+        The entries of an entity are replaced, never changed in place, so a
+        shallow copy is safe to encode in the executor.
+        """
+        return dict(self._entities)
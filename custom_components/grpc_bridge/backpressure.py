@@ -0,0 +1,382 @@
+"""Priority lanes, backpressure and load shedding for incoming bridge traffic."""
+
+import logging
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.components.websocket_api.messages import event_message
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import (
+    ALREADY_DISCOVERED,
+    BULK_PLATFORMS,
+    CONF_CONFIG,
+    CONF_TYPE,
+    DOMAIN,
+    DOMAIN_DATA,
+    INGEST_DRAIN_DELAY,
+    INGEST_DRAIN_SLICE,
+    INGEST_INTERACTIVE_SIZE,
+    INGEST_QUEUE_HIGH_WATER,
+    INGEST_QUEUE_SIZE,
+    LOOP_LAG_INTERVAL,
+    LOOP_LAG_THRESHOLD,
+    SIGNAL_BACKPRESSURE,
+)
+from .util import async_get_bridge_data
+
+if TYPE_CHECKING:
+    import asyncio
+
+_LOGGER = logging.getLogger(__name__)
+
+INGEST_QUEUES = "ingest_queues"
+LANE_INTERACTIVE = "interactive"
+LANE_BULK = "bulk"
+LOOP_MONITOR = "loop_monitor"
+
+
+class LoopLagMonitor:
+    """Measure event loop lag by timing a periodic callback."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        interval: float = LOOP_LAG_INTERVAL,
+        threshold: float = LOOP_LAG_THRESHOLD,
+    ) -> None:
+        """Initialize the monitor."""
+        self._hass = hass
+        self._interval = interval
+        self._threshold = threshold
+        self._expected = 0.0
+        self._handle: asyncio.TimerHandle | None = None
+        self._listeners: list[Callable[[bool], None]] = []
+        self.lag = 0.0
+        self.overloaded = False
+
+    @callback
+    def async_start(self) -> None:
+        """Start measuring."""
+        self._schedule()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop measuring."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    @callback
+    def async_add_listener(self, listener: Callable[[bool], None]) -> Callable:
+        """Listen for changes of the overloaded state."""
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return remove_listener
+
+    def _schedule(self) -> None:
+        """Schedule the next measurement."""
+        self._expected = self._hass.loop.time() + self._interval
+        self._handle = self._hass.loop.call_at(self._expected, self._measure)
+
+    @callback
+    def _measure(self) -> None:
+        """Compare the actual wake up time against the expected one."""
+        self.lag = max(0.0, self._hass.loop.time() - self._expected)
+
+        # Leave the overloaded state only once the lag has clearly recovered
+        if self.overloaded:
+            overloaded = self.lag > self._threshold / 2
+        else:
+            overloaded = self.lag > self._threshold
+
+        if overloaded != self.overloaded:
+            self.overloaded = overloaded
+            if overloaded:
+                _LOGGER.warning(
+                    "Event loop lag of %.3fs, shedding bridge updates", self.lag
+                )
+            else:
+                _LOGGER.info("Event loop lag recovered, resuming bridge updates")
+            for listener in list(self._listeners):
+                listener(overloaded)
+
+        self._schedule()
+
+
+class IngestQueue:
+    """
+    Per connection scheduler with an interactive and a bulk lane.
+
+    Interactive updates are dispatched in order before any bulk update. Bulk
+    updates are dispatched in bounded slices per loop iteration. While the
+    event loop is overloaded or the bulk lane is above its high-water mark,
+    bulk updates are coalesced per entity (latest wins). Both lanes are
+    bounded, the oldest updates are shed when a lane is full.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: ActiveConnection,
+        monitor: LoopLagMonitor,
+    ) -> None:
+        """Initialize the queue."""
+        self._hass = hass
+        self._connection = connection
+        self._monitor = monitor
+        self._interactive: deque[tuple[str, dict[str, Any]]] = deque()
+        self._bulk: deque[list] = deque()
+        self._bulk_latest: dict[str, list] = {}
+        self._handle: asyncio.Handle | None = None
+        self._paced = False
+        self._congested = False
+        self._remove_listener: Callable | None = monitor.async_add_listener(
+            self.handle_overloaded
+        )
+        self.signal_id: int | None = None
+        self.dispatched = {LANE_INTERACTIVE: 0, LANE_BULK: 0}
+        self.max_depth = {LANE_INTERACTIVE: 0, LANE_BULK: 0}
+        self.coalesced = 0
+        self.shed = 0
+
+    @property
+    def overloaded(self) -> bool:
+        """Return if the bridge should slow down."""
+        return self._monitor.overloaded or self._congested
+
+    @property
+    def depth(self) -> dict[str, int]:
+        """Return the number of queued updates per lane."""
+        return {LANE_INTERACTIVE: len(self._interactive), LANE_BULK: len(self._bulk)}
+
+    @callback
+    def async_put_interactive(self, signal: str, msg: dict[str, Any]) -> None:
+        """Queue an update that is dispatched before any bulk update."""
+        if len(self._interactive) >= INGEST_INTERACTIVE_SIZE:
+            self._interactive.popleft()
+            self.shed += 1
+        self._interactive.append((signal, msg))
+        self.max_depth[LANE_INTERACTIVE] = max(
+            self.max_depth[LANE_INTERACTIVE], len(self._interactive)
+        )
+        if self._handle is None or self._paced:
+            self._schedule_drain()
+
+    @callback
+    def async_put_bulk(self, signal: str, msg: dict[str, Any]) -> None:
+        """Queue an update, coalesced per entity while overloaded or backed up."""
+        coalesce = self.overloaded or len(self._bulk) >= INGEST_QUEUE_HIGH_WATER
+        if coalesce and (entry := self._bulk_latest.get(signal)):
+            queued = entry[1]
+            if CONF_CONFIG in queued:
+                # Config updates are partial, keep the keys of the queued one
+                msg = {
+                    **msg,
+                    CONF_CONFIG: queued[CONF_CONFIG] | msg.get(CONF_CONFIG, {}),
+                }
+            # Latest wins, keep the original position to avoid starvation
+            entry[1] = msg
+            self.coalesced += 1
+            return
+
+        if len(self._bulk) >= INGEST_QUEUE_SIZE:
+            self._pop_bulk()
+            self.shed += 1
+        entry = [signal, msg]
+        self._bulk.append(entry)
+        self._bulk_latest[signal] = entry
+        self.max_depth[LANE_BULK] = max(self.max_depth[LANE_BULK], len(self._bulk))
+
+        if not self._congested and len(self._bulk) >= INGEST_QUEUE_HIGH_WATER:
+            # A flood that does not lag the loop still has to slow down
+            self._congested = True
+            self._async_send_backpressure()
+
+        if self._handle is None:
+            self._schedule_drain()
+
+    def _pop_bulk(self) -> tuple[str, dict[str, Any]]:
+        """Remove the oldest bulk update."""
+        signal, msg = entry = self._bulk.popleft()
+        if self._bulk_latest.get(signal) is entry:
+            del self._bulk_latest[signal]
+        return signal, msg
+
+    def _schedule_drain(self) -> None:
+        """Schedule the next drain, bulk only updates are paced while overloaded."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._paced = self._monitor.overloaded and not self._interactive
+        if self._paced:
+            self._handle = self._hass.loop.call_later(INGEST_DRAIN_DELAY, self._drain)
+        else:
+            self._handle = self._hass.loop.call_soon(self._drain)
+
+    def _dispatch(self, bulk_count: int) -> None:
+        """Dispatch all interactive updates, then the oldest bulk updates."""
+        interactive = self._interactive
+        self.dispatched[LANE_INTERACTIVE] += len(interactive)
+        while interactive:
+            signal, msg = interactive.popleft()
+            async_dispatcher_send(self._hass, signal, msg)
+
+        count = min(bulk_count, len(self._bulk))
+        self.dispatched[LANE_BULK] += count
+        for _ in range(count):
+            signal, msg = self._pop_bulk()
+            async_dispatcher_send(self._hass, signal, msg)
+
+    @callback
+    def _drain(self) -> None:
+        """Dispatch all interactive updates, then a slice of the bulk updates."""
+        self._handle = None
+        self._dispatch(INGEST_DRAIN_SLICE)
+
+        if self._congested and len(self._bulk) < INGEST_QUEUE_HIGH_WATER // 2:
+            self._congested = False
+            self._async_send_backpressure()
+
+        if self._bulk or self._interactive:
+            self._schedule_drain()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the lane metrics as a serializable dict."""
+        depth = self.depth
+        return {
+            lane: {
+                "depth": depth[lane],
+                "max_depth": self.max_depth[lane],
+                "dispatched": self.dispatched[lane],
+            }
+            for lane in (LANE_INTERACTIVE, LANE_BULK)
+        } | {
+            "congested": self._congested,
+            "coalesced": self.coalesced,
+            "shed": self.shed,
+        }
+
+    @callback
+    def handle_overloaded(self, overloaded: bool) -> None:  # noqa: FBT001, ARG002
+        """Tell the bridge when the event loop becomes overloaded or recovers."""
+        self._async_send_backpressure()
+
+    @callback
+    def _async_send_backpressure(self) -> None:
+        """Tell the bridge to slow down or resume."""
+        if self.signal_id is None:
+            return
+        self._connection.send_message(
+            event_message(
+                self.signal_id,
+                {
+                    CONF_TYPE: SIGNAL_BACKPRESSURE,
+                    "overloaded": self.overloaded,
+                    "lag": round(self._monitor.lag, 3),
+                    "queued": len(self._bulk),
+                    "coalesced": self.coalesced,
+                    "shed": self.shed,
+                },
+            )
+        )
+
+    @callback
+    def async_close(self) -> None:
+        """Dispatch queued updates and stop listening."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        # The updates were acknowledged when queued, deliver them instead of
+        # dropping them
+        self._dispatch(len(self._bulk))
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+
+
+@callback
+def async_get_ingest_queue(
+    hass: HomeAssistant, connection: ActiveConnection
+) -> IngestQueue | None:
+    """Return the ingest queue of a connection, creating it on first use."""
+    data = hass.data.get(DOMAIN_DATA)
+    if data is None or LOOP_MONITOR not in data:
+        return None
+
+    queues: dict[ActiveConnection, IngestQueue] = data[INGEST_QUEUES]
+    if (queue := queues.get(connection)) is None:
+        queue = queues[connection] = IngestQueue(hass, connection, data[LOOP_MONITOR])
+
+        @callback
+        def close_queue() -> None:
+            queues.pop(connection, None)
+            queue.async_close()
+
+        connection.subscriptions[f"{DOMAIN}_{INGEST_QUEUES}"] = close_queue
+    return queue
+
+
+@callback
+def async_queue_update(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    signal: str,
+    msg: dict[str, Any],
+    *,
+    bulk: bool,
+) -> None:
+    """Queue an update in the interactive or bulk lane of its connection."""
+    if (queue := async_get_ingest_queue(hass, connection)) is None:
+        async_dispatcher_send(hass, signal, msg)
+    elif bulk:
+        queue.async_put_bulk(signal, msg)
+    else:
+        queue.async_put_interactive(signal, msg)
+
+
+@callback
+def async_is_bulk_state(hass: HomeAssistant, bridge_id: str, unique_id: str) -> bool:
+    """Return if a state update of an entity belongs in the bulk lane."""
+    bridge = async_get_bridge_data(hass, bridge_id)
+    if bridge is None:
+        return False
+    return bridge[ALREADY_DISCOVERED].get(unique_id) in BULK_PLATFORMS
+
+
+@callback
+def async_lane_metrics(hass: HomeAssistant) -> dict[str, Any] | None:
+    """Return the loop lag and the lane metrics of every connection."""
+    data = hass.data.get(DOMAIN_DATA)
+    if data is None or LOOP_MONITOR not in data:
+        return None
+    monitor: LoopLagMonitor = data[LOOP_MONITOR]
+    return {
+        "overloaded": monitor.overloaded,
+        "lag": round(monitor.lag, 3),
+        "connections": [queue.as_dict() for queue in data[INGEST_QUEUES].values()],
+    }
+
+
+@callback
+def start_backpressure(hass: HomeAssistant) -> None:
+    """Start the loop lag monitor."""
+    monitor = LoopLagMonitor(hass)
+    hass.data[DOMAIN_DATA][LOOP_MONITOR] = monitor
+    hass.data[DOMAIN_DATA][INGEST_QUEUES] = {}
+    monitor.async_start()
+
+
+@callback
+def stop_backpressure(hass: HomeAssistant) -> None:
+    """Stop the loop lag monitor and dispatch queued updates."""
+    hass.data[DOMAIN_DATA][LOOP_MONITOR].async_stop()
+    for queue in hass.data[DOMAIN_DATA][INGEST_QUEUES].values():
+        queue.async_close()
+    hass.data[DOMAIN_DATA][INGEST_QUEUES].clear()
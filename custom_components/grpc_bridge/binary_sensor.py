@@ -11,36 +11,45 @@ from homeassistant.const import STATE_HOME, STATE_ON, STATE_OPEN, STATE_UNLOCKED
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from . import BridgeStateEntity
-from .const import CONF_STATE, PLATFORM_BINARY_SENSOR
-from .discovery import BRIDGE_ENTITY_ADD_NEW
+from . import BridgeStateEntity, async_create_entities
+from .const import BRIDGE_ENTITY_ADD_NEW, CONF_STATE, PLATFORM_BINARY_SENSOR
+from .util import entry_bridge_id
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,  # noqa: ARG001
+    config_entry: ConfigEntry,
     async_add_devices: Callable[[list[BridgeStateEntity]], None],
 ) -> None:
     """Set up binary sensor platform."""
 
     async def async_discovery(
-        config: dict[str, Any],
-        connection: ActiveConnection,  # noqa: ARG001
+        discovered: list[tuple[dict[str, Any], ActiveConnection]],
     ) -> None:
-        await _async_setup_entity(hass, config, async_add_devices)
-
-    async_dispatcher_connect(
-        hass, BRIDGE_ENTITY_ADD_NEW.format(PLATFORM_BINARY_SENSOR), async_discovery
+        await _async_setup_entities(hass, discovered, async_add_devices)
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            BRIDGE_ENTITY_ADD_NEW.format(
+                entry_bridge_id(config_entry), PLATFORM_BINARY_SENSOR
+            ),
+            async_discovery,
+        )
     )
 
 
-async def _async_setup_entity(
+async def _async_setup_entities(
     hass: HomeAssistant,
-    config: dict[str, Any],
+    discovered: list[tuple[dict[str, Any], ActiveConnection]],
     async_add_devices: Callable[[list[BridgeStateEntity]], None],
 ) -> None:
-    """Set up bridge binary sensor."""
-    async_add_devices([BridgeBinarySensor(hass, config)])
+    """Set up bridge binary sensors."""
+    async_add_devices(
+        async_create_entities(
+            hass, discovered, lambda config, _: BridgeBinarySensor(hass, config)
+        )
+    )
 
 
 class BridgeBinarySensor(BridgeStateEntity, BinarySensorEntity):
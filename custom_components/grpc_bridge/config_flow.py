@@ -2,9 +2,19 @@
 
 from typing import Any
 
+import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
 
-from .const import CONF_NAME, DOMAIN
+from .const import (
+    CONF_BRIDGE_ID,
+    CONF_RECONNECT_GRACE,
+    DEFAULT_BRIDGE_ID,
+    DEFAULT_RECONNECT_GRACE,
+    DOMAIN,
+)
+from .util import entry_bridge_id
 
 
 @config_entries.HANDLERS.register(DOMAIN)
@@ -18,14 +28,66 @@ class BridgeFlowHandler(config_entries.ConfigFlow):
         """Initialize."""
         self._errors = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> "BridgeOptionsFlowHandler":
+        """Get the options flow for this handler."""
+        return BridgeOptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
-        """Handle a user initiated set up flow to create a webhook."""
-        if self._async_current_entries():
-            return self.async_abort(reason="single_instance_allowed")
-        if self.hass.data.get(DOMAIN):
-            return self.async_abort(reason="single_instance_allowed")
+        """Handle a user initiated set up flow for a bridge."""
         if user_input is None:
-            return self.async_show_form(step_id="user")
-        return self.async_create_entry(title=CONF_NAME, data={})
+            return self.async_show_form(
+                step_id="user",
+                data_schema=vol.Schema(
+                    {
+                        vol.Required(
+                            CONF_BRIDGE_ID, default=DEFAULT_BRIDGE_ID
+                        ): cv.slug,
+                    }
+                ),
+                errors=self._errors,
+            )
+
+        bridge_id = user_input[CONF_BRIDGE_ID]
+        # Entries from before multiple bridges were supported serve the default bridge
+        if any(
+            entry_bridge_id(entry) == bridge_id
+            for entry in self._async_current_entries()
+        ):
+            return self.async_abort(reason="already_configured")
+
+        await self.async_set_unique_id(bridge_id)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=bridge_id, data={CONF_BRIDGE_ID: bridge_id}
+        )
+
+
+class BridgeOptionsFlowHandler(config_entries.OptionsFlowWithConfigEntry):
+    """Options flow for gRPC Bridge."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the options of a bridge."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_RECONNECT_GRACE,
+                        default=self.options.get(
+                            CONF_RECONNECT_GRACE, DEFAULT_RECONNECT_GRACE
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=3600)),
+                }
+            ),
+        )
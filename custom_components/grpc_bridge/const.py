@@ -6,8 +6,11 @@ ISSUE_URL = "https://github.com/moonen-home-automation/hass-bridge-companion/iss
 
 DOMAIN = "grpc_bridge"
 DOMAIN_DATA = f"{DOMAIN}_data"
+RECORDER_DOMAIN = "recorder"
 
 CONF_ID = "id"
+CONF_BRIDGE_ID = "bridge_id"
+CONF_RECONNECT_GRACE = "reconnect_grace"
 CONF_TYPE = "type"
 CONF_SERVICE_SLUG = "service_slug"
 CONF_DEVICE_SLUG = "device_slug"
@@ -31,6 +34,31 @@ CONF_OPTIONS = "options"
 CONF_LAST_RESET = "last_reset"
 CONF_STATE_CLASS = "state_class"
 CONF_EVENT_TYPES = "event_types"
+CONF_UNRECORDED_ATTRIBUTES = "unrecorded_attributes"
+CONF_RECORD_ATTRIBUTES = "record_attributes"
+CONF_AGGREGATION_WINDOW = "aggregation_window"
+CONF_AGGREGATION = "aggregation"
+CONF_DEADBAND = "deadband"
+CONF_DEADBAND_PERCENT = "deadband_percent"
+CONF_MAX_SILENCE = "max_silence"
+CONF_STATISTICS = "statistics"
+CONF_START = "start"
+CONF_HISTORY_SIZE = "history_size"
+CONF_ENTITIES = "entities"
+CONF_SINCE = "since"
+CONF_DURATION = "duration"
+CONF_LIMIT = "limit"
+CONF_CURSOR = "cursor"
+CONF_CONFIG_HASH = "config_hash"
+CONF_EXPIRE_AFTER = "expire_after"
+CONF_ENABLED = "enabled"
+CONF_MAX_BYTES = "max_bytes"
+CONF_BACKUPS = "backups"
+CONF_ATTRIBUTE = "attribute"
+CONF_ATTRIBUTE_SIZE_LIMIT = "attribute_size_limit"
+CONF_SENT_AT = "sent_at"
+CONF_SAMPLE_RATE = "sample_rate"
+CONF_RESET = "reset"
 
 # Platforms
 PLATFORM_BINARY_SENSOR = "binary_sensor"
@@ -45,16 +73,82 @@ SUPPORTED_PLATFORMS = [
     PLATFORM_BINARY_SENSOR,
 ]
 
-BRIDGE_ENTITY_STATE = "bridge_entity_state_{}_{}_{}"
-BRIDGE_ENTITY_CONFIG = "bridge_entity_config_{}_{}_{}"
-BRIDGE_ENTITY_EVENT = "bridge_entity_event_{}_{}_{}"
-BRIDGE_ENTITY_ADD = "bridge_entity_add"
+BRIDGE_ENTITY_STATE = "bridge_entity_state_{}"
+BRIDGE_ENTITY_CONFIG = "bridge_entity_config_{}"
+BRIDGE_ENTITY_EVENT = "bridge_entity_event_{}"
+BRIDGE_ENTITY_ADD = "bridge_entity_add_{}"
 BRIDGE_ENTITY_ADD_UPDATED = "bridge_entity_add_updated_{}"
-BRIDGE_ENTITY_ADD_NEW = "bridge_entity_add_new_{}"
-BRIDGE_ENTITY_AVAILABLE = "bridge_entity_available_{}_{}_{}"
+BRIDGE_ENTITY_ADD_NEW = "bridge_entity_add_new_{}_{}"
+BRIDGE_ENTITY_AVAILABLE = "bridge_entity_available_{}"
+BRIDGE_ENTITY_OWNER = "bridge_entity_owner_{}"
+
+# Discovery data
+ALREADY_DISCOVERED = "discovered_components"
+CHANGE_ENTITY_TYPE = "change_entity_type"
+CONFIG_ENTRY_LOCK = "config_entry_lock"
+CONFIG_ENTRY_IS_SETUP = "config_entry_is_setup"
+DISCOVERY_BATCH = "discovery_batch"
+DISCOVERY_DISPATCHER = "discovery_dispatcher"
+DISCOVERY_LOG = "discovery_log"
+INVENTORY = "inventory"
+OWNERSHIP = "ownership"
+
+# Integration data, kept here so importing the integration skips their modules
+ATTRIBUTE_STORE = "attribute_store"
+CONFIG_POOL = "config_pool"
+EXPIRY_SCHEDULER = "expiry_scheduler"
+LATENCY_TRACKER = "latency_tracker"
+TRAFFIC_RECORDER = "traffic_recorder"
+
+# Signals sent to the bridge
+SIGNAL_BACKPRESSURE = "backpressure"
+
+# Backpressure
+BULK_PLATFORMS = [PLATFORM_SENSOR]
+LOOP_LAG_INTERVAL = 1.0
+LOOP_LAG_THRESHOLD = 0.25
+INGEST_QUEUE_SIZE = 5000
+# Bulk depth from which updates are coalesced and the bridge is asked to slow down
+INGEST_QUEUE_HIGH_WATER = 2500
+INGEST_INTERACTIVE_SIZE = 5000
+INGEST_DRAIN_SLICE = 200
+INGEST_DRAIN_DELAY = 0.05
+
+# Discovery batching, messages arriving within the delay are processed together
+DISCOVERY_BATCH_DELAY = 0.005
+DISCOVERY_BATCH_SIZE = 1000
+
+# Discovery logging, payloads are logged at most this often per summary
+DISCOVERY_LOG_INTERVAL = 5.0
+DISCOVERY_LOG_PAYLOADS = 20
+
+# Latency tracing, bucket bounds in milliseconds
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+LATENCY_SAMPLE_RATE = 0.01
+TRACE = "_trace"
+
+# Attributes larger than this many bytes of JSON are moved to the side store
+ATTRIBUTE_SIZE_LIMIT = 4096
+ATTRIBUTE_STORE_SAVE_DELAY = 30
+
+# Traffic recording
+TRAFFIC_FLUSH_INTERVAL = 1.0
+
+# Recent values kept per sensor at most
+HISTORY_SIZE_MAX = 100_000
+
+# Sensor aggregation
+AGGREGATION_MEAN = "mean"
+AGGREGATION_MIN = "min"
+AGGREGATION_MAX = "max"
+AGGREGATION_LAST = "last"
+AGGREGATION_SUM = "sum"
+AGGREGATION_COUNT = "count"
 
 # Defaults
 NAME = "gRPC Bridge Companion"
+DEFAULT_BRIDGE_ID = "default"
+DEFAULT_RECONNECT_GRACE = 0
 NUMBER_ICON = "mdi:numeric"
 SWITCH_ICON = "mdi:electric-switch-closed"
 SELECT_ICON = "mdi:format-list-bulleted"
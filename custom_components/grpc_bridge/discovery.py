@@ -2,112 +2,336 @@
 
 import asyncio
 import logging
+from collections import Counter
 from typing import Any
 
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
+from homeassistant.helpers.event import async_call_later
 
 from .const import (
+    ALREADY_DISCOVERED,
     BRIDGE_ENTITY_ADD,
     BRIDGE_ENTITY_ADD_NEW,
     BRIDGE_ENTITY_ADD_UPDATED,
+    CHANGE_ENTITY_TYPE,
+    CONF_DEVICE_INFO,
     CONF_DEVICE_SLUG,
     CONF_ENTITY_SLUG,
     CONF_PLATFORM,
+    CONF_RECONNECT_GRACE,
     CONF_REMOVE,
     CONF_SERVICE_SLUG,
-    DOMAIN,
-    DOMAIN_DATA,
+    CONFIG_ENTRY_IS_SETUP,
+    CONFIG_ENTRY_LOCK,
+    DEFAULT_RECONNECT_GRACE,
+    DISCOVERY_BATCH,
+    DISCOVERY_BATCH_DELAY,
+    DISCOVERY_BATCH_SIZE,
+    DISCOVERY_DISPATCHER,
+    DISCOVERY_LOG,
+    DISCOVERY_LOG_INTERVAL,
+    DISCOVERY_LOG_PAYLOADS,
+    INVENTORY,
+    OWNERSHIP,
     SUPPORTED_PLATFORMS,
 )
+from .inventory import EntityInventory
+from .ownership import OwnershipIndex
+from .util import async_get_bridge_data, device_identifier, message_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
-ALREADY_DISCOVERED = "discovered_components"
-CHANGE_ENTITY_TYPE = "change_entity_type"
-CONFIG_ENTRY_LOCK = "config_entry_lock"
-CONFIG_ENTRY_IS_SETUP = "config_entry_is_setup"
-DISCOVERY_DISPATCHER = "discovery_dispatcher"
+ACTION_CREATE = "created"
+ACTION_UPDATE = "updated"
+ACTION_REMOVE = "removed"
+ACTION_CHANGE = "changed platform"
 
 
-async def start_discovery(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
-    """Initiate discovery."""
+class DiscoveryLog:
+    """
+    Summarize discovery messages per burst instead of logging each entity.
 
-    async def async_device_message_received(
-        msg: dict[str, Any], connection: ActiveConnection
-    ) -> None:
-        """Process the received message."""
-        platform: str = msg[CONF_PLATFORM]
-        service_slug: str = msg[CONF_SERVICE_SLUG]
-        device_slug: str = msg[CONF_DEVICE_SLUG]
-        entity_slug: str = msg[CONF_ENTITY_SLUG]
+    Payloads are logged at debug level up to a limit per summary. Per entity
+    detail is logged for a service when the level of its own logger, e.g.
+    custom_components.grpc_bridge.discovery.<service_slug>, is set to debug.
+    """
 
-        if platform not in SUPPORTED_PLATFORMS:
-            _LOGGER.warning("Integration %s not supported", platform)
-            return
+    def __init__(self, hass: HomeAssistant, bridge_id: str) -> None:
+        """Initialize the log."""
+        self._hass = hass
+        self._bridge_id = bridge_id
+        self._counts: Counter[tuple[str, str]] = Counter()
+        self._service_loggers: dict[str, logging.Logger] = {}
+        self._payloads = 0
+        self._suppressed = 0
+        self._remove_timer: CALLBACK_TYPE | None = None
 
-        discover_hash = f"{DOMAIN}-{msg[CONF_SERVICE_SLUG]}-{msg[CONF_DEVICE_SLUG]}-{msg[CONF_ENTITY_SLUG]}"  # noqa: E501
-        data = hass.data[DOMAIN_DATA]
+    def _service_logger(self, service_slug: str) -> logging.Logger | None:
+        """Return the logger of a service if it was explicitly set to debug."""
+        if (logger := self._service_loggers.get(service_slug)) is None:
+            logger = self._service_loggers[service_slug] = _LOGGER.getChild(
+                service_slug
+            )
+        # Only a level set on the service logger itself enables the detail
+        if logger.level == logging.NOTSET or not logger.isEnabledFor(logging.DEBUG):
+            return None
+        return logger
 
-        _LOGGER.debug("Discovery message: %s", msg)
+    @callback
+    def async_log(self, action: str, msg: dict[str, Any]) -> None:
+        """Count a discovery message and log it if enabled."""
+        platform: str = msg[CONF_PLATFORM]
+        self._counts[(platform, action)] += 1
 
-        if ALREADY_DISCOVERED not in data:
-            data[ALREADY_DISCOVERED] = {}
-        if discover_hash in data[ALREADY_DISCOVERED]:
-            if data[ALREADY_DISCOVERED][discover_hash] != platform:
-                # Remove old
-                log_text = f"Changing {data[ALREADY_DISCOVERED][discover_hash]} to"
-                msg[CONF_REMOVE] = CHANGE_ENTITY_TYPE
-            elif CONF_REMOVE in msg:
-                log_text = "Removing"
+        if (logger := self._service_logger(msg[CONF_SERVICE_SLUG])) is not None:
+            logger.debug(
+                "%s %s %s %s: %s",
+                action.capitalize(),
+                platform,
+                msg[CONF_DEVICE_SLUG],
+                msg[CONF_ENTITY_SLUG],
+                msg,
+            )
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
+            if self._payloads < DISCOVERY_LOG_PAYLOADS:
+                self._payloads += 1
+                _LOGGER.debug("Discovery message: %s", msg)
             else:
-                # Dispatch update
-                log_text = "Updating"
+                self._suppressed += 1
 
-            _LOGGER.info(
-                "%s %s %s %s %s",
-                log_text,
-                platform,
-                service_slug,
-                device_slug,
-                entity_slug,
+        if self._remove_timer is None:
+            self._remove_timer = async_call_later(
+                self._hass, DISCOVERY_LOG_INTERVAL, self._async_flush
             )
 
-            data[ALREADY_DISCOVERED][discover_hash] = platform
-            async_dispatcher_send(
-                hass, BRIDGE_ENTITY_ADD_UPDATED.format(discover_hash), msg, connection
+    @callback
+    def _async_flush(self, _now: Any = None) -> None:
+        """Log the summary of the discovery messages since the last flush."""
+        self._remove_timer = None
+        if not self._counts:
+            return
+
+        _LOGGER.info(
+            "Discovery of bridge %s: %s",
+            self._bridge_id,
+            ", ".join(
+                f"{platform} {action} {count}"
+                for (platform, action), count in sorted(self._counts.items())
+            ),
+        )
+        if self._suppressed:
+            _LOGGER.debug(
+                "Suppressed %s discovery message payloads, enable debug logging"
+                " of a service logger to see all of its payloads",
+                self._suppressed,
             )
-        else:
-            # Add component
-            _LOGGER.info(
-                "Creating %s %s %s %s", platform, service_slug, device_slug, entity_slug
+        self._counts.clear()
+        self._payloads = 0
+        self._suppressed = 0
+
+    @callback
+    def async_stop(self) -> None:
+        """Log the pending summary and stop the timer."""
+        if self._remove_timer is not None:
+            self._remove_timer()
+        self._async_flush()
+
+
+class DiscoveryBatch:
+    """
+    Buffer discovery messages arriving within a few milliseconds.
+
+    Each batch is processed in one pass: one entity add per platform, one
+    device registry update per device and one update of the discovered
+    entities.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        bridge_id: str,
+        data: dict[str, Any],
+    ) -> None:
+        """Initialize the batch."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._bridge_id = bridge_id
+        self._data = data
+        self._log: DiscoveryLog = data[DISCOVERY_LOG]
+        self._pending: list[tuple[dict[str, Any], ActiveConnection]] = []
+        self._handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(self, msg: dict[str, Any], connection: ActiveConnection) -> None:
+        """Buffer a discovery message."""
+        self._pending.append((msg, connection))
+        if len(self._pending) >= DISCOVERY_BATCH_SIZE:
+            self.async_flush()
+        elif self._handle is None:
+            self._handle = self._hass.loop.call_later(
+                DISCOVERY_BATCH_DELAY, self.async_flush
             )
-            data[ALREADY_DISCOVERED][discover_hash] = platform
 
-            async with data[CONFIG_ENTRY_LOCK]:
-                if platform not in data[CONFIG_ENTRY_IS_SETUP]:
-                    await hass.config_entries.async_forward_entry_setup(
-                        config_entry, platform
+    @callback
+    def async_flush(self) -> None:
+        """Process the buffered messages."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        self._hass.async_create_task(self._async_process(batch))
+
+    @callback
+    def async_stop(self) -> None:
+        """Drop the buffered messages."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._pending.clear()
+
+    async def _async_process(
+        self, batch: list[tuple[dict[str, Any], ActiveConnection]]
+    ) -> None:
+        """Create, update and remove the entities of a batch."""
+        # Batches are processed in order, a batch may wait for a platform setup
+        async with self._data[CONFIG_ENTRY_LOCK]:
+            discovered: dict[str, str] = self._data[ALREADY_DISCOVERED]
+            changes: dict[str, str] = {}
+            created: dict[str, dict[str, tuple[dict[str, Any], ActiveConnection]]] = {}
+            updated: list[tuple[str, dict[str, Any], ActiveConnection]] = []
+
+            for msg, connection in batch:
+                platform: str = msg[CONF_PLATFORM]
+                if platform not in SUPPORTED_PLATFORMS:
+                    _LOGGER.warning("Integration %s not supported", platform)
+                    continue
+
+                discover_hash = message_unique_id(msg)
+                known = changes.get(discover_hash) or discovered.get(discover_hash)
+
+                if known is not None and discover_hash in created.get(known, {}):
+                    # Created earlier in this batch, only the last message counts
+                    del created[known][discover_hash]
+                    if CONF_REMOVE in msg:
+                        del changes[discover_hash]
+                        self._log.async_log(ACTION_REMOVE, msg)
+                        continue
+                    self._log.async_log(
+                        ACTION_UPDATE if known == platform else ACTION_CHANGE, msg
                     )
-                    data[CONFIG_ENTRY_IS_SETUP].add(platform)
+                    known = None
+                elif known is None:
+                    self._log.async_log(ACTION_CREATE, msg)
+
+                if known is None:
+                    # Add component
+                    created.setdefault(platform, {})[discover_hash] = (msg, connection)
+                elif known != platform:
+                    # Remove old
+                    msg[CONF_REMOVE] = CHANGE_ENTITY_TYPE
+                    self._log.async_log(ACTION_CHANGE, msg)
+                    updated.append((discover_hash, msg, connection))
+                elif CONF_REMOVE in msg:
+                    self._log.async_log(ACTION_REMOVE, msg)
+                    updated.append((discover_hash, msg, connection))
+                else:
+                    # Dispatch update
+                    self._log.async_log(ACTION_UPDATE, msg)
+                    updated.append((discover_hash, msg, connection))
+                changes[discover_hash] = platform
+
+            discovered.update(changes)
+
+            self._async_update_devices(updated)
+            for discover_hash, msg, connection in updated:
+                async_dispatcher_send(
+                    self._hass,
+                    BRIDGE_ENTITY_ADD_UPDATED.format(discover_hash),
+                    msg,
+                    connection,
+                )
+
+            await self._async_add_entities(created)
 
+    async def _async_add_entities(
+        self, created: dict[str, dict[str, tuple[dict[str, Any], ActiveConnection]]]
+    ) -> None:
+        """Add the new entities of a batch, one add per platform."""
+        for platform, entities in created.items():
+            if not entities:
+                continue
+            if platform not in self._data[CONFIG_ENTRY_IS_SETUP]:
+                await self._hass.config_entries.async_forward_entry_setup(
+                    self._config_entry, platform
+                )
+                self._data[CONFIG_ENTRY_IS_SETUP].add(platform)
             async_dispatcher_send(
-                hass, BRIDGE_ENTITY_ADD_NEW.format(platform), msg, connection
+                self._hass,
+                BRIDGE_ENTITY_ADD_NEW.format(self._bridge_id, platform),
+                list(entities.values()),
             )
 
-    hass.data[DOMAIN_DATA][CONFIG_ENTRY_LOCK] = asyncio.Lock()
-    hass.data[DOMAIN_DATA][CONFIG_ENTRY_IS_SETUP] = set()
+    @callback
+    def _async_update_devices(
+        self, updated: list[tuple[str, dict[str, Any], ActiveConnection]]
+    ) -> None:
+        """Update each device of the updated entities once."""
+        devices: dict[tuple[str, ...], dict[str, Any]] = {}
+        for _, msg, _ in updated:
+            if CONF_REMOVE in msg or msg.get(CONF_DEVICE_INFO) is None:
+                continue
+            identifier = device_identifier(
+                self._bridge_id, msg[CONF_SERVICE_SLUG], msg[CONF_DEVICE_SLUG]
+            )
+            devices[identifier] = msg[CONF_DEVICE_INFO]
+
+        device_registry = dr.async_get(self._hass)
+        for identifier, device_info in devices.items():
+            device = device_registry.async_get_device({identifier})
+            if device is not None:
+                device_registry.async_update_device(device.id, **device_info)
+
+
+async def start_discovery(
+    hass: HomeAssistant, config_entry: ConfigEntry, bridge_id: str
+) -> None:
+    """Initiate discovery."""
+    data = async_get_bridge_data(hass, bridge_id)
+    assert data is not None  # noqa: S101
+    data[ALREADY_DISCOVERED] = {}
+    data[CONFIG_ENTRY_LOCK] = asyncio.Lock()
+    data[CONFIG_ENTRY_IS_SETUP] = set()
+    data[OWNERSHIP] = OwnershipIndex(
+        hass,
+        bridge_id,
+        config_entry.options.get(CONF_RECONNECT_GRACE, DEFAULT_RECONNECT_GRACE),
+    )
+    data[INVENTORY] = EntityInventory()
+    data[DISCOVERY_LOG] = DiscoveryLog(hass, bridge_id)
+    data[DISCOVERY_BATCH] = discovery_batch = DiscoveryBatch(
+        hass, config_entry, bridge_id, data
+    )
 
-    hass.data[DOMAIN_DATA][DISCOVERY_DISPATCHER] = async_dispatcher_connect(
-        hass, BRIDGE_ENTITY_ADD, async_device_message_received
+    data[DISCOVERY_DISPATCHER] = async_dispatcher_connect(
+        hass, BRIDGE_ENTITY_ADD.format(bridge_id), discovery_batch.async_add
     )
 
 
-def stop_discovery(hass: HomeAssistant) -> None:
+def stop_discovery(hass: HomeAssistant, bridge_id: str) -> None:
     """Remove discovery dispatcher."""
-    hass.data[DOMAIN_DATA][DISCOVERY_DISPATCHER]()
+    data = async_get_bridge_data(hass, bridge_id)
+    assert data is not None  # noqa: S101
+    data[DISCOVERY_DISPATCHER]()
+    data[DISCOVERY_BATCH].async_stop()
+    data[OWNERSHIP].async_stop()
+    data[DISCOVERY_LOG].async_stop()
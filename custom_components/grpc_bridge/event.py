@@ -1,5 +1,6 @@
 """Event platform for gRPC Bridge."""
 
+import time
 from collections.abc import Callable
 from typing import Any
 
@@ -9,8 +10,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from . import BridgeEntity
+from . import BridgeEntity, async_create_entities
 from .const import (
+    BRIDGE_ENTITY_ADD_NEW,
     BRIDGE_ENTITY_EVENT,
     CONF_CONFIG,
     CONF_DEVICE_CLASS,
@@ -18,40 +20,51 @@ from .const import (
     CONF_EVENT_TYPE,
     CONF_EVENT_TYPES,
     PLATFORM_EVENT,
+    TRACE,
 )
-from .discovery import BRIDGE_ENTITY_ADD_NEW
+from .latency import async_finish_trace
+from .util import entry_bridge_id
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,  # noqa: ARG001
+    config_entry: ConfigEntry,
     async_add_devices: Callable[[list[BridgeEntity]], None],
 ) -> None:
     """Set up binary sensor platform."""
 
     async def async_discovery(
-        config: dict[str, Any],
-        connection: ActiveConnection,  # noqa: ARG001
+        discovered: list[tuple[dict[str, Any], ActiveConnection]],
     ) -> None:
-        await _async_setup_entity(hass, config, async_add_devices)
+        await _async_setup_entities(hass, discovered, async_add_devices)
 
-    async_dispatcher_connect(
-        hass, BRIDGE_ENTITY_ADD_NEW.format(PLATFORM_EVENT), async_discovery
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            BRIDGE_ENTITY_ADD_NEW.format(entry_bridge_id(config_entry), PLATFORM_EVENT),
+            async_discovery,
+        )
     )
 
 
-async def _async_setup_entity(
+async def _async_setup_entities(
     hass: HomeAssistant,
-    config: dict[str, Any],
+    discovered: list[tuple[dict[str, Any], ActiveConnection]],
     async_add_devices: Callable[[list[BridgeEntity]], None],
 ) -> None:
-    """Set up bridge binary sensor."""
-    async_add_devices([BridgeEvent(hass, config)])
+    """Set up bridge events."""
+    async_add_devices(
+        async_create_entities(
+            hass, discovered, lambda config, _: BridgeEvent(hass, config)
+        )
+    )
 
 
 class BridgeEvent(BridgeEntity, EventEntity):
     """Event class."""
 
+    _platform = PLATFORM_EVENT
+
     def __init__(self, hass: HomeAssistant, config: dict[str, Any]) -> None:
         """Initialize the binary sensor."""
         self._attr_device_class = config.get(CONF_DEVICE_CLASS)
@@ -71,9 +84,12 @@ class BridgeEvent(BridgeEntity, EventEntity):
     @callback
     def _async_handle_event(self, msg: dict[str, Any]) -> None:
         """Handle event firing."""
+        started = time.perf_counter()
         self._trigger_event(msg[CONF_EVENT_TYPE], msg[CONF_EVENT_DATA])
         self.hass.bus.async_fire(msg[CONF_EVENT_TYPE], msg[CONF_EVENT_DATA])
         self.async_write_ha_state()
+        if TRACE in msg:
+            async_finish_trace(self.hass, self._platform, msg, started)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -81,8 +97,11 @@ class BridgeEvent(BridgeEntity, EventEntity):
 
         self._remove_signal_entity_event = async_dispatcher_connect(
             self.hass,
-            BRIDGE_ENTITY_EVENT.format(
-                self._service_slug, self._device_slug, self._entity_slug
-            ),
+            BRIDGE_ENTITY_EVENT.format(self.unique_id),
             self._async_handle_event,
         )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Run when entity will be removed from hass."""
+        self._remove_signal_entity_event()
+        await super().async_will_remove_from_hass()
@@ -0,0 +1,106 @@
+"""Expiry of entities that stop receiving state updates."""
+
+from collections.abc import Callable
+from heapq import heappop, heappush
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class ExpiryScheduler:
+    """
+    Expire keys with a single timer for all of them.
+
+    Deadlines are kept in a heap that is updated lazily: extending a deadline
+    only updates a dict, and an entry popped before its current deadline is
+    pushed again. Each key has at most one live entry in the heap.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._heap: list[tuple[float, str]] = []
+        self._deadlines: dict[str, float] = {}
+        self._queued: dict[str, float] = {}
+        self._callbacks: dict[str, Callable[[], None]] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self._next: float | None = None
+
+    def __len__(self) -> int:
+        """Return the number of scheduled keys."""
+        return len(self._deadlines)
+
+    @callback
+    def async_schedule(
+        self, key: str, ttl: float, on_expire: Callable[[], None]
+    ) -> None:
+        """Call on_expire after ttl seconds, unless scheduled again before."""
+        deadline = self._hass.loop.time() + ttl
+        self._deadlines[key] = deadline
+        self._callbacks[key] = on_expire
+
+        queued = self._queued.get(key)
+        if queued is None or deadline < queued:
+            # A later deadline is picked up when the queued entry is popped
+            self._push(key, deadline)
+
+    @callback
+    def async_cancel(self, key: str) -> None:
+        """Stop the expiry of a key, its heap entry is skipped when popped."""
+        self._deadlines.pop(key, None)
+        self._queued.pop(key, None)
+        self._callbacks.pop(key, None)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the timer and forget all keys."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._next = None
+        self._heap.clear()
+        self._deadlines.clear()
+        self._queued.clear()
+        self._callbacks.clear()
+
+    def _push(self, key: str, deadline: float) -> None:
+        """Queue a deadline and move the timer forward if it is the earliest."""
+        self._queued[key] = deadline
+        heappush(self._heap, (deadline, key))
+        if self._next is None or deadline < self._next:
+            self._schedule(deadline)
+
+    def _schedule(self, when: float) -> None:
+        """Run the timer at a loop time."""
+        if self._handle is not None:
+            self._handle.cancel()
+        self._next = when
+        self._handle = self._hass.loop.call_at(when, self._async_run)
+
+    @callback
+    def _async_run(self) -> None:
+        """Expire the keys whose deadline passed."""
+        self._handle = None
+        self._next = None
+        now = self._hass.loop.time()
+        heap = self._heap
+
+        while heap and heap[0][0] <= now:
+            queued, key = heappop(heap)
+            if self._queued.get(key) != queued:
+                # Cancelled, or replaced by an earlier entry
+                continue
+            if (deadline := self._deadlines[key]) > now:
+                self._queued[key] = deadline
+                heappush(heap, (deadline, key))
+                continue
+
+            del self._queued[key]
+            del self._deadlines[key]
+            self._callbacks.pop(key)()
+
+        if heap:
+            self._schedule(heap[0][0])
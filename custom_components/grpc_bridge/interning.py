@@ -0,0 +1,56 @@
+"""Sharing of identical config structures between bridge entities."""
+
+import sys
+from typing import Any
+from weakref import WeakValueDictionary
+
+from homeassistant.core import callback
+
+from .util import canonical_json, config_hash
+
+
+class SharedDict(dict):
+    """A dict shared between entities, replaced instead of changed in place."""
+
+    __slots__ = ("__weakref__",)
+
+
+class ConfigPool:
+    """
+    Share identical config and device info dicts between entities.
+
+    Thousands of entities of a bridge carry the same config, so each distinct
+    value is kept once, with interned keys and strings. The pool only holds
+    weak references and forgets a value once no entity uses it anymore.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty pool."""
+        self._shared: WeakValueDictionary[str, SharedDict] = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        """Return the number of shared values."""
+        return len(self._shared)
+
+    @callback
+    def async_intern(self, value: dict[str, Any]) -> dict[str, Any]:
+        """Return the shared instance of a dict."""
+        return self._async_share(canonical_json(value), value)
+
+    @callback
+    def async_intern_config(self, config: dict[str, Any]) -> tuple[dict[str, Any], str]:
+        """Return the shared instance of an entity config and its config hash."""
+        canonical = canonical_json(config)
+        return self._async_share(canonical, config), config_hash(canonical)
+
+    @callback
+    def _async_share(self, canonical: str, value: dict[str, Any]) -> dict[str, Any]:
+        """Return the instance shared for a canonical JSON, adding it if new."""
+        if (shared := self._shared.get(canonical)) is None:
+            shared = self._shared[canonical] = SharedDict(
+                {
+                    sys.intern(key): sys.intern(item) if isinstance(item, str) else item
+                    for key, item in value.items()
+                }
+            )
+        return shared
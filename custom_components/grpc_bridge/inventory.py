@@ -0,0 +1,99 @@
+"""Inventory of the entities of a bridge."""
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from . import BridgeEntity
+
+
+class EntityInventory:
+    """
+    Entities of a bridge, indexed by service and device slug.
+
+    The unique ids matching a filter are sorted once and kept until the
+    inventory changes, so paging through a stable inventory does not sort it
+    again for every page.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty inventory."""
+        self._entities: dict[str, BridgeEntity] = {}
+        self._by_service: dict[str, set[str]] = {}
+        # Device slugs are only unique within their service
+        self._by_device: dict[tuple[str, str], set[str]] = {}
+        self._sorted: dict[tuple[str | None, str | None], list[str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of entities."""
+        return len(self._entities)
+
+    def get(self, unique_id: str) -> "BridgeEntity | None":
+        """Return an entity by unique id."""
+        return self._entities.get(unique_id)
+
+    @callback
+    def async_add(
+        self,
+        unique_id: str,
+        service_slug: str,
+        device_slug: str,
+        entity: "BridgeEntity",
+    ) -> None:
+        """Add an entity that was added to Home Assistant."""
+        self._entities[unique_id] = entity
+        self._by_service.setdefault(service_slug, set()).add(unique_id)
+        self._by_device.setdefault((service_slug, device_slug), set()).add(unique_id)
+        self._sorted.clear()
+
+    @callback
+    def async_remove(self, unique_id: str, service_slug: str, device_slug: str) -> None:
+        """Remove an entity that is removed from Home Assistant."""
+        self._entities.pop(unique_id, None)
+        index: dict[Any, set[str]]
+        for index, key in (
+            (self._by_service, service_slug),
+            (self._by_device, (service_slug, device_slug)),
+        ):
+            if (unique_ids := index.get(key)) is not None:
+                unique_ids.discard(unique_id)
+                if not unique_ids:
+                    del index[key]
+        self._sorted.clear()
+
+    @callback
+    def async_page(
+        self,
+        service_slug: str | None,
+        device_slug: str | None,
+        cursor: str | None,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Return a page of entities ordered by unique id.
+
+        A device filter needs the service filter as well. The cursor is the
+        unique id of the last entity of the previous page, so entities added or
+        removed between pages do not shift the next page.
+        """
+        key = (service_slug, device_slug)
+        if (ordered := self._sorted.get(key)) is None:
+            unique_ids: Iterable[str]
+            if service_slug is not None and device_slug is not None:
+                unique_ids = self._by_device.get((service_slug, device_slug), ())
+            elif service_slug is not None:
+                unique_ids = self._by_service.get(service_slug, ())
+            else:
+                unique_ids = self._entities
+            ordered = self._sorted[key] = sorted(unique_ids)
+
+        start = 0 if cursor is None else bisect_right(ordered, cursor)
+        page = ordered[start : start + limit]
+
+        entities = [self._entities[unique_id].bridge_info() for unique_id in page]
+        next_cursor = page[-1] if start + limit < len(ordered) else None
+        return entities, next_cursor
@@ -0,0 +1,125 @@
+"""End-to-end latency tracing of bridge updates."""
+
+import logging
+import random
+import time
+from bisect import bisect_left
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CONF_SENT_AT,
+    DOMAIN_DATA,
+    LATENCY_BUCKETS,
+    LATENCY_SAMPLE_RATE,
+    LATENCY_TRACKER,
+    TRACE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+STAGE_TRANSPORT = "transport"
+STAGE_HANDLER = "handler"
+STAGE_WRITE = "write"
+
+
+class LatencyHistogram:
+    """Histogram of latencies in milliseconds with fixed buckets."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a latency in milliseconds."""
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a serializable dict."""
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else None,
+            "max": round(self.max, 3),
+            "buckets": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(LATENCY_BUCKETS, self.counts, strict=False)
+                },
+                "inf": self.counts[-1],
+            },
+        }
+
+
+class LatencyTracker:
+    """Latency histograms per platform and stage."""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self.histograms: dict[str, dict[str, LatencyHistogram]] = {}
+        self.sample_rate = LATENCY_SAMPLE_RATE
+
+    def record(self, platform: str, stages: dict[str, float]) -> None:
+        """Record the latencies of one update."""
+        if (histograms := self.histograms.get(platform)) is None:
+            histograms = self.histograms[platform] = {
+                stage: LatencyHistogram()
+                for stage in (STAGE_TRANSPORT, STAGE_HANDLER, STAGE_WRITE)
+            }
+        for stage, value in stages.items():
+            histograms[stage].add(value)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all histograms as a serializable dict."""
+        return {
+            platform: {stage: hist.as_dict() for stage, hist in histograms.items()}
+            for platform, histograms in self.histograms.items()
+        }
+
+
+@callback
+def async_start_trace(msg: dict[str, Any]) -> None:
+    """Stamp an incoming message that carries a send time."""
+    if CONF_SENT_AT in msg:
+        msg[TRACE] = (time.time() - msg[CONF_SENT_AT], time.perf_counter())
+
+
+@callback
+def async_finish_trace(
+    hass: HomeAssistant,
+    platform: str | None,
+    msg: dict[str, Any],
+    started: float,
+) -> None:
+    """Record the latencies of a traced message once its state is written."""
+    transport, received = msg[TRACE]
+    written = time.perf_counter()
+    stages = {
+        STAGE_TRANSPORT: transport * 1000,
+        STAGE_HANDLER: (started - received) * 1000,
+        STAGE_WRITE: (written - started) * 1000,
+    }
+
+    data = hass.data.get(DOMAIN_DATA)
+    if data is None or (tracker := data.get(LATENCY_TRACKER)) is None:
+        return
+    tracker.record(str(platform), stages)
+
+    if _LOGGER.isEnabledFor(logging.DEBUG) and random.random() < tracker.sample_rate:  # noqa: S311
+        _LOGGER.debug(
+            "Trace %s: transport %.3fms, handler %.3fms, write %.3fms (%s)",
+            platform,
+            stages[STAGE_TRANSPORT],
+            stages[STAGE_HANDLER],
+            stages[STAGE_WRITE],
+            msg,
+        )
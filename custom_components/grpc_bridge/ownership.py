@@ -0,0 +1,146 @@
+"""Ownership of bridge entities by websocket connections."""
+
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+
+from .const import BRIDGE_ENTITY_OWNER, DOMAIN, OWNERSHIP
+
+if TYPE_CHECKING:
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OwnershipIndex:
+    """
+    Track which connection of a bridge owns each entity.
+
+    A bridge can shard its entities across several connections. Only the
+    owner may update an entity, commands of the entity are sent to the owner,
+    and entities become orphans when their owner disconnects.
+
+    Entities of a closed connection are only orphaned after the reconnect
+    grace period, and only those that were not claimed again in the meantime.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, bridge_id: str, reconnect_grace: float
+    ) -> None:
+        """Initialize an empty index."""
+        self._hass = hass
+        self._bridge_id = bridge_id
+        self._subscription = f"{DOMAIN}_{OWNERSHIP}_{bridge_id}"
+        self._reconnect_grace = reconnect_grace
+        self._owners: dict[str, ActiveConnection] = {}
+        self._owned: dict[ActiveConnection, set[str]] = {}
+        # Entities waiting for a new owner, keyed to the set they were released in
+        self._released: dict[str, set[str]] = {}
+        self._grace_timers: set[CALLBACK_TYPE] = set()
+
+    def owner(self, unique_id: str) -> "ActiveConnection | None":
+        """Return the connection owning an entity."""
+        return self._owners.get(unique_id)
+
+    def owned(self, connection: "ActiveConnection") -> set[str]:
+        """Return the entities owned by a connection."""
+        return self._owned.get(connection, set())
+
+    def async_check(self, unique_id: str, connection: "ActiveConnection") -> bool:
+        """Return if a connection may update an entity."""
+        owner = self._owners.get(unique_id)
+        return owner is None or owner is connection
+
+    @callback
+    def async_claim(self, unique_id: str, connection: "ActiveConnection") -> None:
+        """Make a connection the owner of an entity."""
+        previous = self._owners.get(unique_id)
+        if previous is connection:
+            return
+        if previous is not None:
+            self._owned[previous].discard(unique_id)
+
+        self._released.pop(unique_id, None)
+        self._owners[unique_id] = connection
+        if (owned := self._owned.get(connection)) is None:
+            owned = self._owned[connection] = set()
+
+            # One close callback per connection instead of one per entity
+            @callback
+            def release_connection() -> None:
+                self._async_release_connection(connection)
+
+            connection.subscriptions[self._subscription] = release_connection
+        owned.add(unique_id)
+
+    @callback
+    def async_set_reconnect_grace(self, reconnect_grace: float) -> None:
+        """Use a new grace period for connections that close from now on."""
+        self._reconnect_grace = reconnect_grace
+
+    @callback
+    def async_release(self, unique_id: str) -> None:
+        """Forget the owner of a removed entity."""
+        self._released.pop(unique_id, None)
+        if (owner := self._owners.pop(unique_id, None)) is not None:
+            self._owned[owner].discard(unique_id)
+
+    @callback
+    def _async_release_connection(self, connection: "ActiveConnection") -> None:
+        """Orphan the entities of a closed connection after the grace period."""
+        released = self._owned.pop(connection, set())
+        for unique_id in released:
+            del self._owners[unique_id]
+        if self._reconnect_grace <= 0:
+            self._async_orphan(released)
+            return
+
+        _LOGGER.debug(
+            "Connection of bridge %s closed, waiting %ss for %d entities to be claimed",
+            self._bridge_id,
+            self._reconnect_grace,
+            len(released),
+        )
+        for unique_id in released:
+            self._released[unique_id] = released
+
+        @callback
+        def grace_expired(_now: datetime) -> None:
+            self._grace_timers.discard(remove_timer)
+            orphans = {
+                unique_id
+                for unique_id in released
+                if self._released.get(unique_id) is released
+            }
+            for unique_id in orphans:
+                del self._released[unique_id]
+            self._async_orphan(orphans)
+
+        remove_timer = async_call_later(
+            self._hass, self._reconnect_grace, grace_expired
+        )
+        self._grace_timers.add(remove_timer)
+
+    @callback
+    def _async_orphan(self, unique_ids: set[str]) -> None:
+        """Make entities without owner unavailable, all in the same iteration."""
+        for unique_id in unique_ids:
+            async_dispatcher_send(
+                self._hass, BRIDGE_ENTITY_OWNER.format(unique_id), None, None
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking the connections."""
+        for connection in self._owned:
+            connection.subscriptions.pop(self._subscription, None)
+        for remove_timer in self._grace_timers:
+            remove_timer()
+        self._grace_timers.clear()
+        self._owners.clear()
+        self._owned.clear()
+        self._released.clear()
@@ -0,0 +1,77 @@
+"""On-demand profiling of the integration's hot paths."""
+
+import asyncio
+import cProfile
+import pstats
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN_DATA
+
+PROFILE_RUNNING = "profile_running"
+
+_COMPONENT_PATH = str(Path(__file__).parent)
+_WEBSOCKET_PATH = str(Path(__file__).with_name("websocket.py"))
+
+
+class ProfilerBusyError(Exception):
+    """Raised when a profile session is already running."""
+
+
+async def async_profile(
+    hass: HomeAssistant, duration: float, limit: int
+) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """
+    Profile the event loop for a number of seconds.
+
+    Returns the top functions of the integration by cumulative time and the
+    number of calls per websocket handler.
+    """
+    data = hass.data[DOMAIN_DATA]
+    if data.get(PROFILE_RUNNING):
+        raise ProfilerBusyError
+
+    profiler = cProfile.Profile()
+    data[PROFILE_RUNNING] = True
+    try:
+        try:
+            profiler.enable()
+        except ValueError as err:
+            # Another profiling tool is already active
+            raise ProfilerBusyError from err
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            profiler.disable()
+    finally:
+        data[PROFILE_RUNNING] = False
+
+    return await hass.async_add_executor_job(_summarize, profiler, limit)
+
+
+def _summarize(
+    profiler: cProfile.Profile, limit: int
+) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """Restrict the profile to frames of the integration."""
+    stats = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+
+    functions = []
+    handler_calls = {}
+    for (filename, lineno, name), (calls, _, total, cumulative, _) in stats.items():
+        if not filename.startswith(_COMPONENT_PATH):
+            continue
+        functions.append(
+            {
+                "function": f"{Path(filename).name}:{lineno}({name})",
+                "calls": calls,
+                "total_time": round(total, 6),
+                "cumulative_time": round(cumulative, 6),
+            }
+        )
+        if filename == _WEBSOCKET_PATH and name.startswith("websocket_"):
+            handler_calls[name] = calls
+
+    functions.sort(key=lambda function: function["cumulative_time"], reverse=True)
+    return functions[:limit], handler_calls
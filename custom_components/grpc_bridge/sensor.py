@@ -1,64 +1,210 @@
 """Sensor platform for gRPC Bridge."""
 
 import logging
+import math
+import time
+from array import array
+from bisect import bisect_right
 from collections.abc import Callable
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 
-from dateutil import parser
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.components.sensor.const import SensorDeviceClass
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_STATE, CONF_UNIT_OF_MEASUREMENT, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
 
-from . import BridgeStateEntity
+from . import BridgeStateEntity, async_create_entities
 from .const import (
+    AGGREGATION_COUNT,
+    AGGREGATION_LAST,
+    AGGREGATION_MAX,
+    AGGREGATION_MEAN,
+    AGGREGATION_MIN,
+    AGGREGATION_SUM,
     BRIDGE_ENTITY_ADD_NEW,
+    CONF_AGGREGATION,
+    CONF_AGGREGATION_WINDOW,
+    CONF_ATTRIBUTES,
     CONF_CONFIG,
+    CONF_DEADBAND,
+    CONF_DEADBAND_PERCENT,
+    CONF_HISTORY_SIZE,
     CONF_LAST_RESET,
+    CONF_MAX_SILENCE,
     CONF_STATE_CLASS,
+    HISTORY_SIZE_MAX,
     PLATFORM_SENSOR,
 )
+from .util import entry_bridge_id
 
 _LOGGER = logging.getLogger(__name__)
 
+# Count, sum, min, max and last value of an empty aggregation window
+_EMPTY_WINDOW = (0.0, 0.0, math.inf, -math.inf, 0.0)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,  # noqa: ARG001
+    config_entry: ConfigEntry,
     async_add_entities: Callable[[list[BridgeStateEntity]], None],
 ) -> None:
     """Set up sensor platform."""
 
     async def async_discover(
-        config: dict[str, Any],
-        connection: ActiveConnection,  # noqa: ARG001
+        discovered: list[tuple[dict[str, Any], ActiveConnection]],
     ) -> None:
-        await _async_setup_entity(hass, config, async_add_entities)
+        await _async_setup_entities(hass, discovered, async_add_entities)
 
-    async_dispatcher_connect(
-        hass,
-        BRIDGE_ENTITY_ADD_NEW.format(PLATFORM_SENSOR),
-        async_discover,
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            BRIDGE_ENTITY_ADD_NEW.format(
+                entry_bridge_id(config_entry), PLATFORM_SENSOR
+            ),
+            async_discover,
+        )
     )
 
 
-async def _async_setup_entity(
+async def _async_setup_entities(
     hass: HomeAssistant,
-    config: dict[str, Any],
+    discovered: list[tuple[dict[str, Any], ActiveConnection]],
     async_add_entities: Callable[[list[BridgeStateEntity]], None],
 ) -> None:
-    """Set up the gRPC bridge sensor."""
-    async_add_entities([BridgeSensor(hass, config)])
+    """Set up the gRPC bridge sensors."""
+    async_add_entities(
+        async_create_entities(
+            hass, discovered, lambda config, _: BridgeSensor(hass, config)
+        )
+    )
+
+
+def _optional_float(value: Any) -> float | None:
+    """Return a config value as float, or None when it is not set."""
+    return float(value) if value is not None else None
+
+
+def _numeric(value: Any) -> float | None:
+    """Return a state as float, or None when it is not numeric."""
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def parse_datetime(value: Any) -> datetime:
+    """Parse a date string, only loading dateutil for non ISO formats."""
+    if isinstance(value, str) and (parsed := dt_util.parse_datetime(value)):
+        return parsed
+
+    from dateutil import parser
+
+    return parser.parse(value)
+
+
+class WindowAggregate:
+    """Fixed-size numeric buffer accumulating the values of one window."""
+
+    __slots__ = ("_buffer",)
+
+    _COUNT, _SUM, _MIN, _MAX, _LAST = range(5)
+
+    def __init__(self) -> None:
+        """Initialize an empty window."""
+        self._buffer = array("d", _EMPTY_WINDOW)
+
+    def add(self, value: float) -> None:
+        """Add a value to the window."""
+        buffer = self._buffer
+        buffer[self._COUNT] += 1
+        buffer[self._SUM] += value
+        buffer[self._MIN] = min(buffer[self._MIN], value)
+        buffer[self._MAX] = max(buffer[self._MAX], value)
+        buffer[self._LAST] = value
+
+    def pop(self) -> dict[str, float] | None:
+        """Return the statistics of the window and start a new one."""
+        buffer = self._buffer
+        count = int(buffer[self._COUNT])
+        if count == 0:
+            return None
+
+        stats = {
+            AGGREGATION_MEAN: buffer[self._SUM] / count,
+            AGGREGATION_MIN: buffer[self._MIN],
+            AGGREGATION_MAX: buffer[self._MAX],
+            AGGREGATION_LAST: buffer[self._LAST],
+            AGGREGATION_SUM: buffer[self._SUM],
+            AGGREGATION_COUNT: count,
+        }
+        buffer[:] = array("d", _EMPTY_WINDOW)
+        return stats
+
+
+class RecentValues:
+    """Fixed-size ring buffer of the last numeric values and their times."""
+
+    __slots__ = ("_count", "_next", "_times", "_values")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty buffer."""
+        self._times = array("d", bytes(capacity * 8))
+        self._values = array("d", bytes(capacity * 8))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of values in the buffer."""
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        """Return the number of values the buffer holds at most."""
+        return len(self._times)
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a value, replacing the oldest one when the buffer is full."""
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % len(self._times)
+        self._count = min(self._count + 1, len(self._times))
+
+    def items(self, since: float | None = None) -> list[tuple[float, float]]:
+        """Return the (timestamp, value) pairs after since, oldest first."""
+        start = self._next - self._count
+        if start < 0:
+            times = self._times[start:] + self._times[: self._next]
+            values = self._values[start:] + self._values[: self._next]
+        else:
+            times = self._times[start : self._next]
+            values = self._values[start : self._next]
+
+        first = 0 if since is None else bisect_right(times, since)
+        return list(zip(times[first:], values[first:], strict=True))
 
 
 class BridgeSensor(BridgeStateEntity, SensorEntity):
     """gRPC Bridge sensor class."""
 
     _platform = PLATFORM_SENSOR
+    _aggregate: WindowAggregate | None = None
+    _aggregation_window: float | None = None
+    _remove_window_timer: Callable[[], None] | None = None
+    _window_ready = False
+    _deadband: float | None = None
+    _deadband_percent: float | None = None
+    _max_silence: float | None = None
+    _written_value: float | None = None
+    _written_at = 0.0
+    _recent: RecentValues | None = None
 
     def __init__(self, hass: HomeAssistant, config: dict[str, Any]) -> None:
         """Initialize the sensor."""
@@ -76,7 +222,7 @@ class BridgeSensor(BridgeStateEntity, SensorEntity):
         reset = self._config.get(CONF_LAST_RESET)
         if reset is not None:
             try:
-                return parser.parse(reset)
+                return parse_datetime(reset)
             except (ValueError, TypeError):
                 _LOGGER.error(  # noqa: TRY400
                     "Invalid ISO date string (%s): %s requires last_reset to be an iso date formatted string",  # noqa: E501
@@ -94,7 +240,7 @@ class BridgeSensor(BridgeStateEntity, SensorEntity):
             SensorDeviceClass.DATE,
         ]:
             try:
-                return parser.parse(state)
+                return parse_datetime(state)
             except (ValueError, TypeError):
                 _LOGGER.error(  # noqa: TRY400
                     "Invalid ISO date string (%s): %s has a timestamp device class",
@@ -105,10 +251,94 @@ class BridgeSensor(BridgeStateEntity, SensorEntity):
 
         return state
 
+    @callback
+    def handle_entity_update(self, msg: dict[str, Any]) -> None:
+        """Update entity state, or accumulate it when aggregating."""
+        if self._aggregate is None:
+            if self._within_deadband(msg):
+                if self._expire_after is not None:
+                    self.async_reset_expiry()
+                return
+            super().handle_entity_update(msg)
+            return
+        if self._expire_after is not None:
+            self.async_reset_expiry()
+
+        try:
+            self._aggregate.add(float(msg.get(CONF_STATE)))  # type: ignore[arg-type]
+        except (ValueError, TypeError):
+            _LOGGER.debug(
+                "Ignoring non numeric state %s for aggregating sensor %s",
+                msg.get(CONF_STATE),
+                self.entity_id,
+            )
+            return
+        self._window_attributes = msg.get(CONF_ATTRIBUTES, {})
+
+    def _within_deadband(self, msg: dict[str, Any]) -> bool:
+        """Return if a state is too close to the last written one to write it."""
+        if self._deadband is None and self._deadband_percent is None:
+            return False
+        if self._written_value is None or self._expired:
+            return False
+        if (value := _numeric(msg.get(CONF_STATE))) is None:
+            return False
+        if (
+            self._max_silence is not None
+            and time.monotonic() - self._written_at >= self._max_silence
+        ):
+            return False
+
+        band = max(
+            self._deadband or 0.0,
+            abs(self._written_value) * (self._deadband_percent or 0.0) / 100,
+        )
+        return abs(value - self._written_value) <= band
+
+    @callback
+    def _async_flush_window(self, now: datetime) -> None:  # noqa: ARG002
+        """Write one aggregated state for the past window."""
+        assert self._aggregate is not None  # noqa: S101
+        stats = self._aggregate.pop()
+        if stats is None:
+            return
+
+        aggregation = self._config.get(CONF_AGGREGATION, AGGREGATION_MEAN)
+        self.async_write_entity_update(
+            {
+                CONF_STATE: stats.get(aggregation, stats[AGGREGATION_MEAN]),
+                CONF_ATTRIBUTES: {**self._window_attributes, **stats},
+            }
+        )
+
+    @callback
+    def _async_setup_window(self) -> None:
+        """(Re)start the aggregation timer."""
+        if self._remove_window_timer is not None:
+            self._remove_window_timer()
+            self._remove_window_timer = None
+
+        if self._aggregation_window is None:
+            self._aggregate = None
+            return
+
+        if self._aggregate is None:
+            self._aggregate = WindowAggregate()
+            self._window_attributes: dict[str, Any] = {}
+        self._remove_window_timer = async_track_time_interval(
+            self.hass,
+            self._async_flush_window,
+            timedelta(seconds=self._aggregation_window),
+        )
+
     def update_entity_state_attributes(self, msg: dict[str, Any]) -> None:
         """Update entity state attributes."""
         super().update_entity_state_attributes(msg)
         self._attr_native_value = self.convert_state(msg.get(CONF_STATE))
+        self._written_value = _numeric(msg.get(CONF_STATE))
+        self._written_at = time.monotonic()
+        if self._recent is not None and self._written_value is not None:
+            self._recent.add(time.time(), self._written_value)
 
     def update_discovery_config(self, msg: dict[str, Any]) -> None:
         """Update entity config."""
@@ -118,6 +348,54 @@ class BridgeSensor(BridgeStateEntity, SensorEntity):
         )
         self._attr_unit_of_measurement = None
         self._attr_state_class = msg[CONF_CONFIG].get(CONF_STATE_CLASS)
+        self._deadband = _optional_float(msg[CONF_CONFIG].get(CONF_DEADBAND))
+        self._deadband_percent = _optional_float(
+            msg[CONF_CONFIG].get(CONF_DEADBAND_PERCENT)
+        )
+        self._max_silence = _optional_float(msg[CONF_CONFIG].get(CONF_MAX_SILENCE))
+        self._update_recent(msg[CONF_CONFIG].get(CONF_HISTORY_SIZE))
+
+        window = msg[CONF_CONFIG].get(CONF_AGGREGATION_WINDOW)
+        window = float(window) if window else None
+        if window is not None and window <= 0:
+            error = f"aggregation_window must be positive, got {window}"
+            raise ValueError(error)
+        if window != self._aggregation_window:
+            self._aggregation_window = window
+            if self._window_ready:
+                self._async_setup_window()
+
+    def _update_recent(self, history_size: Any) -> None:
+        """Resize the buffer of recent values, keeping the newest ones."""
+        capacity = min(int(history_size or 0), HISTORY_SIZE_MAX)
+        previous = self._recent
+        if capacity == (previous.capacity if previous is not None else 0):
+            return
+
+        self._recent = RecentValues(capacity) if capacity > 0 else None
+        if previous is not None and self._recent is not None:
+            for timestamp, value in previous.items()[-capacity:]:
+                self._recent.add(timestamp, value)
+
+    def recent_values(self, since: float | None) -> list[tuple[float, float]] | None:
+        """Return the recent values after since, or None without a buffer."""
+        if self._recent is None:
+            return None
+        return self._recent.items(since)
+
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+        self._window_ready = True
+        self._async_setup_window()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Run when entity will be removed from hass."""
+        self._window_ready = False
+        if self._remove_window_timer is not None:
+            self._remove_window_timer()
+            self._remove_window_timer = None
+        await super().async_will_remove_from_hass()
 
     def entity_category_mapper(self, category: str) -> EntityCategory | None:
         """Map bridge category to Home Assistant entity category."""
@@ -18,38 +18,49 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from . import BridgeStateEntity
+from . import BridgeStateEntity, async_create_entities
 from .const import BRIDGE_ENTITY_ADD_NEW, CONF_CONFIG, PLATFORM_SWITCH, SWITCH_ICON
+from .util import entry_bridge_id
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,  # noqa: ARG001
+    config_entry: ConfigEntry,
     async_add_devices: Callable[[list[BridgeStateEntity]], None],
 ) -> None:
     """Set up binary sensor platform."""
 
     async def async_discovery(
-        config: dict[str, Any],
-        connection: ActiveConnection,
+        discovered: list[tuple[dict[str, Any], ActiveConnection]],
     ) -> None:
-        await _async_setup_entity(hass, config, async_add_devices, connection)
-
-    async_dispatcher_connect(
-        hass, BRIDGE_ENTITY_ADD_NEW.format(PLATFORM_SWITCH), async_discovery
+        await _async_setup_entities(hass, discovered, async_add_devices)
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            BRIDGE_ENTITY_ADD_NEW.format(
+                entry_bridge_id(config_entry), PLATFORM_SWITCH
+            ),
+            async_discovery,
+        )
     )
 
 
-async def _async_setup_entity(
+async def _async_setup_entities(
     hass: HomeAssistant,
-    config: dict[str, Any],
+    discovered: list[tuple[dict[str, Any], ActiveConnection]],
     async_add_devices: Callable[[list[BridgeStateEntity]], None],
-    connection: ActiveConnection,
 ) -> None:
-    """Set up bridge binary sensor."""
-    async_add_devices([BridgeSwitch(hass, config, connection)])
+    """Set up bridge switches."""
+    async_add_devices(
+        async_create_entities(
+            hass,
+            discovered,
+            lambda config, connection: BridgeSwitch(hass, config, connection),
+        )
+    )
 
 
 class BridgeSwitch(BridgeStateEntity, SwitchEntity):
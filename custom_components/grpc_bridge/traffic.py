@@ -0,0 +1,118 @@
+"""Opt-in recording of incoming bridge commands for replay."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from functools import wraps
+from pathlib import Path
+from typing import Any
+
+from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
+
+from .const import DOMAIN, DOMAIN_DATA, TRAFFIC_FLUSH_INTERVAL, TRAFFIC_RECORDER
+
+TRAFFIC_FILE = f"{DOMAIN}_traffic.jsonl"
+
+WebSocketHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]], None]
+
+
+class TrafficRecorder:
+    """
+    Append incoming commands to a JSON lines file with rotation.
+
+    Each line holds the arrival time and the validated message. Lines are
+    buffered on the event loop and written in the executor.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, path: Path, max_bytes: int, backups: int
+    ) -> None:
+        """Initialize the recorder."""
+        self._hass = hass
+        self.path = path
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self._buffer: list[bytes] = []
+        self._remove_timer: CALLBACK_TYPE | None = None
+        self._remove_stop_listener: CALLBACK_TYPE | None = None
+        self._write_lock = asyncio.Lock()
+        self._stopped = False
+        self.recorded = 0
+
+    @callback
+    def async_start(self) -> None:
+        """Write the remaining lines when Home Assistant stops."""
+        self._remove_stop_listener = self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+
+    @callback
+    def async_record(self, msg: dict[str, Any]) -> None:
+        """Buffer a message, serialized now as handlers may change it."""
+        if self._stopped:
+            return
+        self._buffer.append(json_bytes({"t": time.time(), "msg": msg}) + b"\n")
+        self.recorded += 1
+        if self._remove_timer is None:
+            self._remove_timer = async_call_later(
+                self._hass, TRAFFIC_FLUSH_INTERVAL, self._async_flush
+            )
+
+    async def _async_flush(self, _now: Any = None) -> None:
+        """Write the buffered lines, one write at a time to keep their order."""
+        self._remove_timer = None
+        async with self._write_lock:
+            if not self._buffer:
+                return
+            lines, self._buffer = self._buffer, []
+            await self._hass.async_add_executor_job(self._write, lines)
+
+    def _write(self, lines: list[bytes]) -> None:
+        """Append lines to the file and rotate it when it is full."""
+        with self.path.open("ab") as file:
+            file.writelines(lines)
+            full = file.tell() >= self._max_bytes
+        if full:
+            for index in range(self._backups - 1, 0, -1):
+                backup = self.path.with_name(f"{self.path.name}.{index}")
+                if backup.exists():
+                    backup.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+            if self._backups:
+                self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+            else:
+                self.path.unlink()
+
+    async def _async_handle_stop(self, _event: Event) -> None:
+        """Stop recording when Home Assistant stops."""
+        self._remove_stop_listener = None
+        await self.async_stop()
+
+    async def async_stop(self) -> None:
+        """Stop recording and write the remaining lines after any running write."""
+        self._stopped = True
+        if self._remove_stop_listener is not None:
+            self._remove_stop_listener()
+            self._remove_stop_listener = None
+        if self._remove_timer is not None:
+            self._remove_timer()
+            self._remove_timer = None
+        await self._async_flush()
+
+
+def recorded(handler: WebSocketHandler) -> WebSocketHandler:
+    """Record the messages of a websocket handler while the recorder is on."""
+
+    @wraps(handler)
+    def record_message(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        data = hass.data.get(DOMAIN_DATA)
+        if data is not None and (recorder := data.get(TRAFFIC_RECORDER)) is not None:
+            recorder.async_record(msg)
+        handler(hass, connection, msg)
+
+    return record_message
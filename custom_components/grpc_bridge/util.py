@@ -0,0 +1,73 @@
+"""Helpers for gRPC Bridge."""
+
+import hashlib
+import json
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_BRIDGE_ID,
+    CONF_DEVICE_SLUG,
+    CONF_ENTITY_SLUG,
+    CONF_SERVICE_SLUG,
+    DEFAULT_BRIDGE_ID,
+    DOMAIN,
+    DOMAIN_DATA,
+)
+
+BRIDGES = "bridges"
+
+
+def entry_bridge_id(entry: ConfigEntry) -> str:
+    """Return the id of the bridge a config entry is bound to."""
+    return entry.data.get(CONF_BRIDGE_ID, DEFAULT_BRIDGE_ID)
+
+
+def entity_unique_id(
+    bridge_id: str, service_slug: str, device_slug: str, entity_slug: str
+) -> str:
+    """Return the unique id of a bridge entity."""
+    if bridge_id == DEFAULT_BRIDGE_ID:
+        # Entities of the default bridge keep their original unique id
+        return f"{DOMAIN}-{service_slug}-{device_slug}-{entity_slug}"
+    return f"{DOMAIN}-{bridge_id}-{service_slug}-{device_slug}-{entity_slug}"
+
+
+def message_unique_id(msg: dict[str, Any]) -> str:
+    """Return the unique id of the entity a message is about."""
+    return entity_unique_id(
+        msg.get(CONF_BRIDGE_ID, DEFAULT_BRIDGE_ID),
+        msg[CONF_SERVICE_SLUG],
+        msg[CONF_DEVICE_SLUG],
+        msg[CONF_ENTITY_SLUG],
+    )
+
+
+def canonical_json(config: dict[str, Any]) -> str:
+    """Return the JSON of a config with sorted keys and without whitespace."""
+    return json.dumps(config, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+def config_hash(config: dict[str, Any] | str) -> str:
+    """Return a hash of an entity config that the bridge can compute as well."""
+    canonical = config if isinstance(config, str) else canonical_json(config)
+    return hashlib.sha1(canonical.encode(), usedforsecurity=False).hexdigest()
+
+
+def device_identifier(
+    bridge_id: str, service_slug: str, device_slug: str
+) -> tuple[str, ...]:
+    """Return the device registry identifier of a bridge device."""
+    if bridge_id == DEFAULT_BRIDGE_ID:
+        return (DOMAIN, service_slug, device_slug)
+    return (DOMAIN, bridge_id, service_slug, device_slug)
+
+
+def async_get_bridge_data(hass: HomeAssistant, bridge_id: str) -> dict | None:
+    """Return the runtime data of a loaded bridge."""
+    data = hass.data.get(DOMAIN_DATA)
+    if data is None:
+        return None
+    return data[BRIDGES].get(bridge_id)
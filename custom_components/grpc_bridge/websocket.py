@@ -1,8 +1,13 @@
 """WebSocket API for gRPC Bridge."""
 
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
+from homeassistant.components.sensor.const import SensorStateClass
+from homeassistant.components.websocket_api import (
+    DOMAIN as WEBSOCKET_DOMAIN,
+)
 from homeassistant.components.websocket_api import (
     async_register_command,
 )
@@ -15,35 +20,81 @@ from homeassistant.components.websocket_api.decorators import (
 from homeassistant.components.websocket_api.messages import (
     result_message,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
     config_validation as cv,
 )
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_registry import async_get
+from homeassistant.helpers.importlib import async_import_module
 
+from .backpressure import (
+    async_get_ingest_queue,
+    async_is_bulk_state,
+    async_lane_metrics,
+    async_queue_update,
+)
 from .const import (
+    AGGREGATION_MAX,
+    AGGREGATION_MEAN,
+    AGGREGATION_MIN,
+    AGGREGATION_SUM,
+    ALREADY_DISCOVERED,
+    ATTRIBUTE_STORE,
     BRIDGE_ENTITY_ADD,
     BRIDGE_ENTITY_AVAILABLE,
     BRIDGE_ENTITY_CONFIG,
     BRIDGE_ENTITY_EVENT,
+    BRIDGE_ENTITY_OWNER,
     BRIDGE_ENTITY_STATE,
+    CONF_ATTRIBUTE,
     CONF_ATTRIBUTES,
     CONF_AVAILABLE,
+    CONF_BACKUPS,
+    CONF_BRIDGE_ID,
     CONF_CONFIG,
+    CONF_CURSOR,
     CONF_DEVICE_INFO,
     CONF_DEVICE_SLUG,
+    CONF_DURATION,
+    CONF_ENABLED,
+    CONF_ENTITIES,
     CONF_ENTITY_SLUG,
     CONF_EVENT_DATA,
     CONF_EVENT_TYPE,
     CONF_ID,
+    CONF_LAST_RESET,
+    CONF_LIMIT,
+    CONF_MAX_BYTES,
     CONF_PLATFORM,
     CONF_REMOVE,
+    CONF_RESET,
+    CONF_SAMPLE_RATE,
+    CONF_SENT_AT,
     CONF_SERVICE_SLUG,
+    CONF_SINCE,
+    CONF_START,
     CONF_STATE,
+    CONF_STATISTICS,
     CONF_TYPE,
+    DEFAULT_BRIDGE_ID,
     DOMAIN,
+    DOMAIN_DATA,
+    INVENTORY,
+    LATENCY_TRACKER,
+    OWNERSHIP,
+    RECORDER_DOMAIN,
+    SUPPORTED_PLATFORMS,
+    TRAFFIC_RECORDER,
 )
+from .latency import LatencyTracker, async_start_trace
+from .traffic import TRAFFIC_FILE, TrafficRecorder, recorded
+from .util import async_get_bridge_data, entity_unique_id, message_unique_id
+
+if TYPE_CHECKING:
+    from .attribute_store import AttributeStore
+    from .inventory import EntityInventory
 
 
 def register_websocket_handlers(hass: HomeAssistant) -> None:
@@ -54,18 +105,47 @@ def register_websocket_handlers(hass: HomeAssistant) -> None:
     async_register_command(hass, websocket_entity_state)
     async_register_command(hass, websocket_entity_config)
     async_register_command(hass, websocket_entity_event)
+    async_register_command(hass, websocket_entity_claim)
+    async_register_command(hass, websocket_entity_list)
+    async_register_command(hass, websocket_entity_attribute_get)
+    async_register_command(hass, websocket_sensor_statistics_import)
+    async_register_command(hass, websocket_sensor_recent)
+    async_register_command(hass, websocket_signal_subscribe)
+    async_register_command(hass, websocket_debug_profile)
+    async_register_command(hass, websocket_debug_latency)
+    async_register_command(hass, websocket_debug_lanes)
+    async_register_command(hass, websocket_debug_record)
+
+
+@callback
+def _async_check_owner(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+    unique_id: str,
+) -> bool:
+    """Send an error and return False if another connection owns the entity."""
+    data = async_get_bridge_data(hass, msg[CONF_BRIDGE_ID])
+    if data is None or data[OWNERSHIP].async_check(unique_id, connection):
+        return True
+    connection.send_error(
+        msg[CONF_ID], "not_owner", f"Entity {unique_id} is owned by another connection"
+    )
+    return False
 
 
 @require_admin
 @websocket_command(
     {
         vol.Required(CONF_TYPE): "bridge/entity/remove",
+        vol.Optional(CONF_BRIDGE_ID, default=DEFAULT_BRIDGE_ID): cv.string,
         vol.Required(CONF_SERVICE_SLUG): cv.string,
         vol.Required(CONF_DEVICE_SLUG): cv.string,
         vol.Required(CONF_ENTITY_SLUG): cv.string,
         vol.Required(CONF_PLATFORM): cv.string,
     }
 )
+@recorded
 @async_response
 async def websocket_entity_remove(
     hass: HomeAssistant,
@@ -73,11 +153,13 @@ async def websocket_entity_remove(
     msg: dict[str, Any],
 ) -> None:
     """Handle the removal of an entity."""
+    unique_id = message_unique_id(msg)
+    if not _async_check_owner(hass, connection, msg, unique_id):
+        return
+
     entity_registry = async_get(hass)
     entity_id = entity_registry.async_get_entity_id(
-        DOMAIN,
-        msg[CONF_PLATFORM],
-        f"{DOMAIN}-{msg[CONF_SERVICE_SLUG]}-{msg[CONF_DEVICE_SLUG]}-{msg[CONF_ENTITY_SLUG]}",
+        msg[CONF_PLATFORM], DOMAIN, unique_id
     )
     assert entity_id is not None  # noqa: S101
     entity_registry.async_remove(entity_id)
@@ -89,24 +171,26 @@ async def websocket_entity_remove(
 @websocket_command(
     {
         vol.Required(CONF_TYPE): "bridge/entity/available",
+        vol.Optional(CONF_BRIDGE_ID, default=DEFAULT_BRIDGE_ID): cv.string,
         vol.Required(CONF_SERVICE_SLUG): cv.string,
         vol.Required(CONF_DEVICE_SLUG): cv.string,
         vol.Required(CONF_ENTITY_SLUG): cv.string,
         vol.Required(CONF_AVAILABLE): cv.boolean,
     }
 )
+@recorded
 def websocket_entity_available(
     hass: HomeAssistant,
     connection: ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
     """Handle availability update of entity."""
-    async_dispatcher_send(
-        hass,
-        BRIDGE_ENTITY_AVAILABLE.format(
-            msg[CONF_SERVICE_SLUG], msg[CONF_DEVICE_SLUG], msg[CONF_ENTITY_SLUG]
-        ),
-        msg,
+    unique_id = message_unique_id(msg)
+    if not _async_check_owner(hass, connection, msg, unique_id):
+        return
+
+    async_queue_update(
+        hass, connection, BRIDGE_ENTITY_AVAILABLE.format(unique_id), msg, bulk=False
     )
     connection.send_message(result_message(msg[CONF_ID]))
 
@@ -115,6 +199,7 @@ def websocket_entity_available(
 @websocket_command(
     {
         vol.Required(CONF_TYPE): "bridge/entity/add",
+        vol.Optional(CONF_BRIDGE_ID, default=DEFAULT_BRIDGE_ID): cv.string,
         vol.Required(CONF_SERVICE_SLUG): cv.string,
         vol.Required(CONF_DEVICE_SLUG): cv.string,
         vol.Required(CONF_ENTITY_SLUG): cv.string,
@@ -126,12 +211,28 @@ def websocket_entity_available(
         vol.Optional(CONF_ATTRIBUTES): dict,
     }
 )
+@recorded
 def websocket_entity_add(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle the adding of a new entity."""
+    data = async_get_bridge_data(hass, msg[CONF_BRIDGE_ID])
+    if data is None:
+        connection.send_error(
+            msg[CONF_ID], "unknown_bridge", f"Bridge {msg[CONF_BRIDGE_ID]} not set up"
+        )
+        return
+
+    # The discovering connection owns the entity unless another one does
+    unique_id = message_unique_id(msg)
+    if not _async_check_owner(hass, connection, msg, unique_id):
+        return
+    # Discovery ignores unsupported platforms, their entities are never released
+    if msg[CONF_PLATFORM] in SUPPORTED_PLATFORMS:
+        data[OWNERSHIP].async_claim(unique_id, connection)
+
     async_dispatcher_send(
-        hass, BRIDGE_ENTITY_ADD.format(msg[CONF_PLATFORM]), msg, connection
+        hass, BRIDGE_ENTITY_ADD.format(msg[CONF_BRIDGE_ID]), msg, connection
     )
     connection.send_message(result_message(msg[CONF_ID]))
 
@@ -140,23 +241,31 @@ def websocket_entity_add(
 @websocket_command(
     {
         vol.Required(CONF_TYPE): "bridge/entity/state",
+        vol.Optional(CONF_BRIDGE_ID, default=DEFAULT_BRIDGE_ID): cv.string,
         vol.Required(CONF_SERVICE_SLUG): cv.string,
         vol.Required(CONF_DEVICE_SLUG): cv.string,
         vol.Required(CONF_ENTITY_SLUG): cv.string,
         vol.Optional(CONF_STATE): vol.Any(bool, str, int, float, None),
         vol.Optional(CONF_ATTRIBUTES): dict,
+        vol.Optional(CONF_SENT_AT): vol.Coerce(float),
     }
 )
+@recorded
 def websocket_entity_state(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle an entity state update."""
-    async_dispatcher_send(
+    unique_id = message_unique_id(msg)
+    if not _async_check_owner(hass, connection, msg, unique_id):
+        return
+
+    async_start_trace(msg)
+    async_queue_update(
         hass,
-        BRIDGE_ENTITY_STATE.format(
-            msg[CONF_SERVICE_SLUG], msg[CONF_DEVICE_SLUG], msg[CONF_ENTITY_SLUG]
-        ),
+        connection,
+        BRIDGE_ENTITY_STATE.format(unique_id),
         msg,
+        bulk=async_is_bulk_state(hass, msg[CONF_BRIDGE_ID], unique_id),
     )
     connection.send_message(result_message(msg[CONF_ID]))
 
@@ -165,22 +274,24 @@ def websocket_entity_state(
 @websocket_command(
     {
         vol.Required(CONF_TYPE): "bridge/entity/config",
+        vol.Optional(CONF_BRIDGE_ID, default=DEFAULT_BRIDGE_ID): cv.string,
         vol.Required(CONF_SERVICE_SLUG): cv.string,
         vol.Required(CONF_DEVICE_SLUG): cv.string,
         vol.Required(CONF_ENTITY_SLUG): cv.string,
         vol.Optional(CONF_CONFIG): dict,
     }
 )
+@recorded
 def websocket_entity_config(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle an entity config update."""
-    async_dispatcher_send(
-        hass,
-        BRIDGE_ENTITY_CONFIG.format(
-            msg[CONF_SERVICE_SLUG], msg[CONF_DEVICE_SLUG], msg[CONF_ENTITY_SLUG]
-        ),
-        msg,
+    unique_id = message_unique_id(msg)
+    if not _async_check_owner(hass, connection, msg, unique_id):
+        return
+
+    async_queue_update(
+        hass, connection, BRIDGE_ENTITY_CONFIG.format(unique_id), msg, bulk=True
     )
     connection.send_message(result_message(msg[CONF_ID]))
 
@@ -189,24 +300,428 @@ def websocket_entity_config(
 @websocket_command(
     {
         vol.Required(CONF_TYPE): "bridge/entity/event",
+        vol.Optional(CONF_BRIDGE_ID, default=DEFAULT_BRIDGE_ID): cv.string,
         vol.Required(CONF_SERVICE_SLUG): cv.string,
         vol.Required(CONF_DEVICE_SLUG): cv.string,
         vol.Required(CONF_ENTITY_SLUG): cv.string,
         vol.Required(CONF_EVENT_TYPE): cv.string,
         vol.Optional(CONF_EVENT_DATA): dict,
+        vol.Optional(CONF_SENT_AT): vol.Coerce(float),
     }
 )
+@recorded
 def websocket_entity_event(
     hass: HomeAssistant,
     connection: ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
     """Handle the triggering of an entity event."""
+    unique_id = message_unique_id(msg)
+    if not _async_check_owner(hass, connection, msg, unique_id):
+        return
+
+    async_start_trace(msg)
+    async_queue_update(
+        hass, connection, BRIDGE_ENTITY_EVENT.format(unique_id), msg, bulk=False
+    )
+    connection.send_message(result_message(msg[CONF_ID]))
+
+
+@require_admin
+@websocket_command(
+    {
+        vol.Required(CONF_TYPE): "bridge/entity/claim",
+        vol.Optional(CONF_BRIDGE_ID, default=DEFAULT_BRIDGE_ID): cv.string,
+        vol.Required(CONF_SERVICE_SLUG): cv.string,
+        vol.Required(CONF_DEVICE_SLUG): cv.string,
+        vol.Required(CONF_ENTITY_SLUG): cv.string,
+    }
+)
+@recorded
+def websocket_entity_claim(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Hand over the ownership of an entity to this connection."""
+    data = async_get_bridge_data(hass, msg[CONF_BRIDGE_ID])
+    unique_id = message_unique_id(msg)
+    if data is None or unique_id not in data[ALREADY_DISCOVERED]:
+        connection.send_error(
+            msg[CONF_ID], "not_found", f"Entity {unique_id} not discovered"
+        )
+        return
+
+    data[OWNERSHIP].async_claim(unique_id, connection)
     async_dispatcher_send(
-        hass,
-        BRIDGE_ENTITY_EVENT.format(
-            msg[CONF_SERVICE_SLUG], msg[CONF_DEVICE_SLUG], msg[CONF_ENTITY_SLUG]
+        hass, BRIDGE_ENTITY_OWNER.format(unique_id), connection, msg[CONF_ID]
+    )
+    connection.send_message(result_message(msg[CONF_ID]))
+
+
+@require_admin
+@websocket_command(
+    {
+        vol.Required(CONF_TYPE): "bridge/entity/list",
+        vol.Optional(CONF_BRIDGE_ID, default=DEFAULT_BRIDGE_ID): cv.string,
+        vol.Optional(CONF_SERVICE_SLUG): cv.string,
+        vol.Optional(CONF_DEVICE_SLUG): cv.string,
+        vol.Optional(CONF_CURSOR): cv.string,
+        vol.Optional(CONF_LIMIT, default=1000): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=10000)
         ),
-        msg,
+    }
+)
+def websocket_entity_list(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return a page of the entities known for a bridge."""
+    data = async_get_bridge_data(hass, msg[CONF_BRIDGE_ID])
+    if data is None:
+        connection.send_error(
+            msg[CONF_ID], "unknown_bridge", f"Bridge {msg[CONF_BRIDGE_ID]} not set up"
+        )
+        return
+
+    if CONF_DEVICE_SLUG in msg and CONF_SERVICE_SLUG not in msg:
+        connection.send_error(
+            msg[CONF_ID], "invalid_format", "device_slug requires service_slug"
+        )
+        return
+
+    inventory: EntityInventory = data[INVENTORY]
+    entities, next_cursor = inventory.async_page(
+        msg.get(CONF_SERVICE_SLUG),
+        msg.get(CONF_DEVICE_SLUG),
+        msg.get(CONF_CURSOR),
+        msg[CONF_LIMIT],
     )
+    connection.send_message(
+        result_message(msg[CONF_ID], {"entities": entities, "next_cursor": next_cursor})
+    )
+
+
+@require_admin
+@websocket_command(
+    {
+        vol.Required(CONF_TYPE): "bridge/entity/attribute_get",
+        vol.Optional(CONF_BRIDGE_ID, default=DEFAULT_BRIDGE_ID): cv.string,
+        vol.Required(CONF_SERVICE_SLUG): cv.string,
+        vol.Required(CONF_DEVICE_SLUG): cv.string,
+        vol.Required(CONF_ENTITY_SLUG): cv.string,
+        vol.Optional(CONF_ATTRIBUTE): cv.string,
+    }
+)
+def websocket_entity_attribute_get(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the full value of attributes moved to the side store."""
+    data = hass.data.get(DOMAIN_DATA)
+    if data is None:
+        connection.send_error(msg[CONF_ID], "not_loaded", "Integration not loaded")
+        return
+
+    store: AttributeStore = data[ATTRIBUTE_STORE]
+    attributes = store.get(message_unique_id(msg))
+    if CONF_ATTRIBUTE in msg:
+        if msg[CONF_ATTRIBUTE] not in attributes:
+            connection.send_error(
+                msg[CONF_ID], "not_found", f"Attribute {msg[CONF_ATTRIBUTE]} not stored"
+            )
+            return
+        attributes = {msg[CONF_ATTRIBUTE]: attributes[msg[CONF_ATTRIBUTE]]}
+    connection.send_message(result_message(msg[CONF_ID], {"attributes": attributes}))
+
+
+@require_admin
+@websocket_command(
+    {
+        vol.Required(CONF_TYPE): "bridge/sensor/statistics_import",
+        vol.Optional(CONF_BRIDGE_ID, default=DEFAULT_BRIDGE_ID): cv.string,
+        vol.Required(CONF_SERVICE_SLUG): cv.string,
+        vol.Required(CONF_DEVICE_SLUG): cv.string,
+        vol.Required(CONF_ENTITY_SLUG): cv.string,
+        vol.Required(CONF_STATISTICS): vol.All(
+            [
+                {
+                    vol.Required(CONF_START): cv.datetime,
+                    vol.Optional(AGGREGATION_MEAN): vol.Coerce(float),
+                    vol.Optional(AGGREGATION_MIN): vol.Coerce(float),
+                    vol.Optional(AGGREGATION_MAX): vol.Coerce(float),
+                    vol.Optional(CONF_STATE): vol.Coerce(float),
+                    vol.Optional(AGGREGATION_SUM): vol.Coerce(float),
+                    vol.Optional(CONF_LAST_RESET): cv.datetime,
+                }
+            ],
+            vol.Length(min=1),
+        ),
+    }
+)
+@async_response
+async def websocket_sensor_statistics_import(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Import hourly statistics of a sensor in one call."""
+    unique_id = message_unique_id(msg)
+    if not _async_check_owner(hass, connection, msg, unique_id):
+        return
+
+    data = async_get_bridge_data(hass, msg[CONF_BRIDGE_ID])
+    entity = data[INVENTORY].get(unique_id) if data is not None else None
+    if entity is None or entity.entity_id is None:
+        connection.send_error(
+            msg[CONF_ID], "not_found", f"Entity {unique_id} not found"
+        )
+        return
+
+    state_class = getattr(entity, "state_class", None)
+    if state_class is None:
+        connection.send_error(
+            msg[CONF_ID], "not_supported", f"Entity {unique_id} has no state_class"
+        )
+        return
+    if RECORDER_DOMAIN not in hass.config.components:
+        connection.send_error(msg[CONF_ID], "not_supported", "Recorder not loaded")
+        return
+
+    # The recorder is only needed for backfills, so not imported with the integration
+    statistics = await async_import_module(
+        hass, "homeassistant.components.recorder.statistics"
+    )
+    metadata = {
+        "has_mean": state_class == SensorStateClass.MEASUREMENT,
+        "has_sum": state_class
+        in (SensorStateClass.TOTAL, SensorStateClass.TOTAL_INCREASING),
+        "name": None,
+        "source": RECORDER_DOMAIN,
+        "statistic_id": entity.entity_id,
+        "unit_of_measurement": entity.native_unit_of_measurement,
+    }
+    try:
+        statistics.async_import_statistics(hass, metadata, msg[CONF_STATISTICS])
+    except HomeAssistantError as err:
+        connection.send_error(msg[CONF_ID], "invalid_format", str(err))
+        return
+
+    connection.send_message(
+        result_message(
+            msg[CONF_ID],
+            {
+                "statistic_id": entity.entity_id,
+                "imported": len(msg[CONF_STATISTICS]),
+            },
+        )
+    )
+
+
+@require_admin
+@websocket_command(
+    {
+        vol.Required(CONF_TYPE): "bridge/sensor/recent",
+        vol.Optional(CONF_BRIDGE_ID, default=DEFAULT_BRIDGE_ID): cv.string,
+        vol.Required(CONF_ENTITIES): vol.All(
+            [
+                {
+                    vol.Required(CONF_SERVICE_SLUG): cv.string,
+                    vol.Required(CONF_DEVICE_SLUG): cv.string,
+                    vol.Required(CONF_ENTITY_SLUG): cv.string,
+                }
+            ],
+            vol.Length(min=1),
+        ),
+        vol.Optional(CONF_SINCE): vol.Coerce(float),
+    }
+)
+def websocket_sensor_recent(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the recent values of sensors without querying the recorder."""
+    data = async_get_bridge_data(hass, msg[CONF_BRIDGE_ID])
+    if data is None:
+        connection.send_error(
+            msg[CONF_ID], "unknown_bridge", f"Bridge {msg[CONF_BRIDGE_ID]} not set up"
+        )
+        return
+
+    inventory: EntityInventory = data[INVENTORY]
+    entities = []
+    for slugs in msg[CONF_ENTITIES]:
+        entity = inventory.get(
+            entity_unique_id(
+                msg[CONF_BRIDGE_ID],
+                slugs[CONF_SERVICE_SLUG],
+                slugs[CONF_DEVICE_SLUG],
+                slugs[CONF_ENTITY_SLUG],
+            )
+        )
+        # Unknown entities and sensors without history_size have no values
+        recent_values = getattr(entity, "recent_values", None)
+        values = recent_values(msg.get(CONF_SINCE)) if recent_values else None
+        entities.append({**slugs, "values": values})
+    connection.send_message(result_message(msg[CONF_ID], {"entities": entities}))
+
+
+@require_admin
+@websocket_command(
+    {
+        vol.Required(CONF_TYPE): "bridge/signal/subscribe",
+    }
+)
+def websocket_signal_subscribe(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to signals from the integration, such as backpressure."""
+    queue = async_get_ingest_queue(hass, connection)
+    if queue is None:
+        connection.send_error(msg[CONF_ID], "not_loaded", "Integration not loaded")
+        return
+    queue.signal_id = msg[CONF_ID]
     connection.send_message(result_message(msg[CONF_ID]))
+
+
+@require_admin
+@websocket_command(
+    {
+        vol.Required(CONF_TYPE): "bridge/debug/profile",
+        vol.Optional(CONF_DURATION, default=10): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=300)
+        ),
+        vol.Optional(CONF_LIMIT, default=25): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+    }
+)
+@async_response
+async def websocket_debug_profile(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Profile the integration for a number of seconds."""
+    if DOMAIN_DATA not in hass.data:
+        connection.send_error(msg[CONF_ID], "not_loaded", "Integration not loaded")
+        return
+
+    # Only needed when profiling, so not imported with the integration
+    profiler = await async_import_module(hass, f"{__package__}.profiler")
+
+    try:
+        functions, handler_calls = await profiler.async_profile(
+            hass, msg[CONF_DURATION], msg[CONF_LIMIT]
+        )
+    except profiler.ProfilerBusyError:
+        connection.send_error(
+            msg[CONF_ID], "profile_running", "A profile session is already running"
+        )
+        return
+
+    commands = {
+        command: handler_calls.get(handler.__name__, 0)
+        for command, (handler, _) in hass.data[WEBSOCKET_DOMAIN].items()
+        if command.startswith("bridge/")
+    }
+    connection.send_message(
+        result_message(msg[CONF_ID], {"functions": functions, "commands": commands})
+    )
+
+
+@require_admin
+@websocket_command(
+    {
+        vol.Required(CONF_TYPE): "bridge/debug/latency",
+        vol.Optional(CONF_SAMPLE_RATE): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=1)
+        ),
+        vol.Optional(CONF_RESET, default=False): cv.boolean,
+    }
+)
+def websocket_debug_latency(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the latency histograms of traced updates."""
+    data = hass.data.get(DOMAIN_DATA)
+    if data is None:
+        connection.send_error(msg[CONF_ID], "not_loaded", "Integration not loaded")
+        return
+
+    tracker: LatencyTracker = data[LATENCY_TRACKER]
+    if CONF_SAMPLE_RATE in msg:
+        tracker.sample_rate = msg[CONF_SAMPLE_RATE]
+    result = tracker.as_dict()
+    if msg[CONF_RESET]:
+        tracker.histograms.clear()
+    connection.send_message(result_message(msg[CONF_ID], result))
+
+
+@require_admin
+@websocket_command(
+    {
+        vol.Required(CONF_TYPE): "bridge/debug/lanes",
+    }
+)
+def websocket_debug_lanes(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the queue depth of the priority lanes of every connection."""
+    if (metrics := async_lane_metrics(hass)) is None:
+        connection.send_error(msg[CONF_ID], "not_loaded", "Integration not loaded")
+        return
+    connection.send_message(result_message(msg[CONF_ID], metrics))
+
+
+@require_admin
+@websocket_command(
+    {
+        vol.Required(CONF_TYPE): "bridge/debug/record",
+        vol.Required(CONF_ENABLED): cv.boolean,
+        vol.Optional(CONF_MAX_BYTES, default=50_000_000): vol.All(
+            vol.Coerce(int), vol.Range(min=1_000_000)
+        ),
+        vol.Optional(CONF_BACKUPS, default=3): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=20)
+        ),
+    }
+)
+@async_response
+async def websocket_debug_record(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Start or stop recording incoming bridge commands."""
+    data = hass.data.get(DOMAIN_DATA)
+    if data is None:
+        connection.send_error(msg[CONF_ID], "not_loaded", "Integration not loaded")
+        return
+
+    recorder: TrafficRecorder | None = data.get(TRAFFIC_RECORDER)
+    if msg[CONF_ENABLED] and recorder is None:
+        recorder = data[TRAFFIC_RECORDER] = TrafficRecorder(
+            hass,
+            Path(hass.config.path(TRAFFIC_FILE)),
+            msg[CONF_MAX_BYTES],
+            msg[CONF_BACKUPS],
+        )
+        recorder.async_start()
+    elif not msg[CONF_ENABLED] and recorder is not None:
+        data.pop(TRAFFIC_RECORDER)
+        await recorder.async_stop()
+
+    result = {"recording": msg[CONF_ENABLED]}
+    if recorder is not None:
+        result |= {"path": str(recorder.path), "recorded": recorder.recorded}
+    connection.send_message(result_message(msg[CONF_ID], result))
@@ -0,0 +1,115 @@
+"""
+Compare the memory of entity configs with and without interning.
+
+Decodes the discovery payloads of a simulated inventory with the JSON decoder
+of the websocket API, so every entity gets its own config and device info
+dicts, whose keys are already shared by the decoder's key cache. Measures
+the memory they retain when kept per entity and when shared through the
+config pool.
+
+Usage: python scripts/benchmark_memory.py [--entities 20000]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from homeassistant.util.json import json_loads  # noqa: E402
+
+from custom_components.grpc_bridge.interning import ConfigPool  # noqa: E402
+
+PLATFORM_CONFIGS = [
+    {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+        "icon": "mdi:thermometer",
+    },
+    {
+        "device_class": "humidity",
+        "state_class": "measurement",
+        "unit_of_measurement": "%",
+        "icon": "mdi:water-percent",
+    },
+    {"device_class": "power", "state_class": "measurement", "unit_of_measurement": "W"},
+    {"device_class": "energy", "state_class": "total_increasing"},
+]
+
+
+def payloads(entities: int, per_device: int, named: bool) -> list[bytes]:  # noqa: FBT001
+    """Return the encoded discovery payloads of the inventory."""
+    messages = []
+    for index in range(entities):
+        config = dict(PLATFORM_CONFIGS[index % len(PLATFORM_CONFIGS)])
+        if named:
+            config["name"] = f"Entity {index}"
+        device = index // per_device
+        messages.append(
+            json.dumps(
+                {
+                    "config": config,
+                    "device_info": {
+                        "name": f"Device {device}",
+                        "manufacturer": "Bridge",
+                        "model": "Sensor hub",
+                    },
+                }
+            ).encode()
+        )
+    return messages
+
+
+def measure(
+    messages: list[bytes],
+    keep: Callable[[dict[str, Any]], tuple[dict[str, Any], dict[str, Any]]],
+) -> int:
+    """Return the memory retained by the kept structures in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    kept = [keep(json_loads(message)) for message in messages]
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return retained
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entities", type=int, default=20000)
+    parser.add_argument("--per-device", type=int, default=10)
+    parser.add_argument(
+        "--named", action="store_true", help="give every entity its own name"
+    )
+    args = parser.parse_args()
+    messages = payloads(args.entities, args.per_device, args.named)
+
+    copied = measure(messages, lambda msg: (msg["config"], msg["device_info"]))
+    pool = ConfigPool()
+    interned = measure(
+        messages,
+        lambda msg: (
+            pool.async_intern_config(msg["config"])[0],
+            pool.async_intern(msg["device_info"]),
+        ),
+    )
+
+    sys.stdout.write(
+        f"{args.entities} entities, {args.per_device} per device\n"
+        f"  per entity copies {copied / 1024:10.1f} KiB\n"
+        f"  interned          {interned / 1024:10.1f} KiB"
+        f" ({1 - interned / copied:.0%} saved)\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
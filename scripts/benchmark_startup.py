@@ -0,0 +1,204 @@
+"""
+Benchmark the startup cost of the gRPC Bridge integration.
+
+Measures the import time of the integration and each platform module in a
+fresh interpreter, and the wall time of async_setup_entry and of
+rediscovering the entity inventory with an empty and with large cached
+inventories in the entity registry.
+
+Usage: python scripts/benchmark_startup.py [--entities 0 1000 10000]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "custom_components.grpc_bridge"
+MODULES = [
+    PACKAGE,
+    f"{PACKAGE}.sensor",
+    f"{PACKAGE}.binary_sensor",
+    f"{PACKAGE}.switch",
+    f"{PACKAGE}.event",
+]
+
+# Modules Home Assistant has already imported by the time it loads the integration
+PRELOAD = """
+import homeassistant.core
+import homeassistant.helpers.device_registry
+import homeassistant.helpers.dispatcher
+import homeassistant.helpers.entity
+import homeassistant.helpers.entity_platform
+import homeassistant.helpers.entity_registry
+import homeassistant.helpers.event
+import homeassistant.components.websocket_api
+import homeassistant.components.binary_sensor
+import homeassistant.components.event
+import homeassistant.components.sensor
+import homeassistant.components.switch
+"""
+
+IMPORT_SNIPPET = """
+import importlib, sys, time
+sys.path.insert(0, {root!r})
+{preload}
+start = time.perf_counter()
+importlib.import_module({module!r})
+print(time.perf_counter() - start)
+"""
+
+SETUP_SNIPPET = """
+import asyncio, sys
+sys.path.insert(0, {root!r})
+sys.path.insert(0, {scripts!r})
+from benchmark_startup import async_benchmark_setup
+print(*asyncio.run(async_benchmark_setup({entities})))
+"""
+
+
+class _BenchConnection:
+    """Minimal stand-in for a websocket connection of the bridge."""
+
+    def __init__(self) -> None:
+        self.subscriptions = {}
+
+    def send_message(self, msg: object) -> None:
+        """Drop messages sent to the bridge."""
+
+
+def _run(snippet: str) -> str:
+    """Run a snippet in a fresh interpreter and return its output."""
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-c", snippet],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+
+def benchmark_imports(repeat: int) -> dict[str, float]:
+    """Return the median import time of each module in milliseconds."""
+    results = {}
+    for module in MODULES:
+        snippet = IMPORT_SNIPPET.format(root=str(ROOT), preload=PRELOAD, module=module)
+        timings = [float(_run(snippet)) * 1000 for _ in range(repeat)]
+        results[module] = statistics.median(timings)
+    return results
+
+
+async def async_benchmark_setup(entities: int) -> tuple[float, float]:
+    """Return the setup and rediscovery wall time in milliseconds."""
+    import asyncio
+
+    from homeassistant import bootstrap, loader
+    from homeassistant.config_entries import ConfigEntries, ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers import entity_registry as er
+    from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+    from custom_components.grpc_bridge.const import (
+        BRIDGE_ENTITY_ADD,
+        DEFAULT_BRIDGE_ID,
+        DISCOVERY_BATCH_DELAY,
+        DOMAIN,
+        PLATFORM_SENSOR,
+    )
+    from custom_components.grpc_bridge.util import entity_unique_id
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        Path(config_dir, "custom_components").symlink_to(ROOT / "custom_components")
+        hass = HomeAssistant(config_dir)
+        loader.async_setup(hass)
+        hass.config_entries = ConfigEntries(hass, {})
+        await bootstrap.async_load_base_functionality(hass)
+
+        entry = ConfigEntry(
+            data={},
+            domain=DOMAIN,
+            minor_version=1,
+            options={},
+            source="user",
+            title=DEFAULT_BRIDGE_ID,
+            unique_id=None,
+            version=1,
+        )
+        inventory = [
+            (f"service_{i // 1000}", f"device_{i // 10}", f"entity_{i}")
+            for i in range(entities)
+        ]
+
+        # Entities left in the registry by a previous run
+        registry = er.async_get(hass)
+        for slugs in inventory:
+            registry.async_get_or_create(
+                PLATFORM_SENSOR,
+                DOMAIN,
+                entity_unique_id(DEFAULT_BRIDGE_ID, *slugs),
+                config_entry=entry,
+            )
+
+        start = time.perf_counter()
+        await hass.config_entries.async_add(entry)
+        await hass.async_block_till_done()
+        setup = time.perf_counter() - start
+
+        # The bridge pushes its inventory again after Home Assistant started
+        connection = _BenchConnection()
+        start = time.perf_counter()
+        for msg_id, (service_slug, device_slug, entity_slug) in enumerate(inventory):
+            async_dispatcher_send(
+                hass,
+                BRIDGE_ENTITY_ADD.format(DEFAULT_BRIDGE_ID),
+                {
+                    "id": msg_id,
+                    "bridge_id": DEFAULT_BRIDGE_ID,
+                    "service_slug": service_slug,
+                    "device_slug": device_slug,
+                    "entity_slug": entity_slug,
+                    "platform": PLATFORM_SENSOR,
+                    "device_info": {"name": device_slug},
+                    "config": {"unit_of_measurement": "°C"},
+                    "state": msg_id,
+                },
+                connection,
+            )
+        # Let the last discovery batch flush before waiting for the entities
+        await asyncio.sleep(DISCOVERY_BATCH_DELAY)
+        await hass.async_block_till_done()
+        rediscovery = time.perf_counter() - start
+
+        await hass.async_stop(force=True)
+
+    return setup * 1000, rediscovery * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entities", type=int, nargs="+", default=[0, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.stdout.write("Import time (median of fresh interpreters)\n")
+    for module, duration in benchmark_imports(args.repeat).items():
+        sys.stdout.write(f"  {module:<45} {duration:8.2f} ms\n")
+
+    sys.stdout.write("\nSetup time (fresh interpreter per inventory size)\n")
+    for entities in args.entities:
+        snippet = SETUP_SNIPPET.format(
+            root=str(ROOT), scripts=str(ROOT / "scripts"), entities=entities
+        )
+        setup, rediscovery = (float(value) for value in _run(snippet).split())
+        sys.stdout.write(
+            f"  {entities:>6} entities: async_setup_entry {setup:8.2f} ms,"
+            f" rediscovery {rediscovery:9.2f} ms\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
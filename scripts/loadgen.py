@@ -0,0 +1,383 @@
+"""
+Generate bridge traffic against a running Home Assistant instance.
+
+Connects to the websocket API like the gRPC bridge does, discovers a
+simulated inventory of services, devices and entities, and then drives
+state, config, available and event messages at the given rates. Reports
+the ack latency per command and the errors returned by Home Assistant.
+
+Usage: python scripts/loadgen.py --token <long-lived token> [--duration 60]
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import aiohttp
+
+PLATFORMS = ("sensor", "binary_sensor", "switch", "event")
+STATE_PLATFORMS = ("sensor", "binary_sensor", "switch")
+DEFAULT_MIX = "sensor=70,binary_sensor=15,switch=10,event=5"
+
+PLATFORM_CONFIG = {
+    "sensor": {"unit_of_measurement": "°C", "device_class": "temperature"},
+    "binary_sensor": {},
+    "switch": {},
+    "event": {"event_types": ["pressed", "held"]},
+}
+
+# Interval of the rate limiter, messages due within a tick are sent together
+TICK = 0.01
+
+
+@dataclass(frozen=True, slots=True)
+class SimulatedEntity:
+    """An entity of the simulated bridge."""
+
+    service_slug: str
+    device_slug: str
+    entity_slug: str
+    platform: str
+
+    def key(self, bridge_id: str) -> dict[str, str]:
+        """Return the fields identifying the entity in a message."""
+        return {
+            "bridge_id": bridge_id,
+            "service_slug": self.service_slug,
+            "device_slug": self.device_slug,
+            "entity_slug": self.entity_slug,
+        }
+
+
+class Stats:
+    """Ack latencies and errors per command type."""
+
+    def __init__(self) -> None:
+        """Initialize empty stats."""
+        self.sent: Counter[str] = Counter()
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: Counter[tuple[str, str]] = Counter()
+        self.events: Counter[int | None] = Counter()
+
+    def ack(self, command: str, latency: float) -> None:
+        """Record the ack of a command."""
+        self.latencies.setdefault(command, []).append(latency * 1000)
+
+    def error(self, command: str, code: str) -> None:
+        """Record an error returned for a command."""
+        self.errors[(command, code)] += 1
+
+    def report(self, elapsed: float, unanswered: int) -> str:
+        """Return a report of the stats."""
+        lines = [
+            f"{'command':<26}{'sent':>9}{'rate/s':>9}"
+            f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+        ]
+        for command, sent in sorted(self.sent.items()):
+            latencies = sorted(self.latencies.get(command, [0.0]))
+            lines.append(
+                f"{command:<26}{sent:>9}{sent / elapsed:>9.1f}"
+                f"{_percentile(latencies, 50):>9.2f}"
+                f"{_percentile(latencies, 95):>9.2f}"
+                f"{_percentile(latencies, 99):>9.2f}"
+                f"{latencies[-1]:>9.2f}"
+            )
+        lines.append(
+            f"Unanswered: {unanswered}, events received: {self.events.total()}"
+        )
+        lines.append(f"Errors: {sum(self.errors.values())}")
+        lines.extend(
+            f"  {command} {code}: {count}"
+            for (command, code), count in sorted(self.errors.items())
+        )
+        return "\n".join(lines)
+
+
+def _percentile(values: list[float], percentile: int) -> float:
+    """Return a percentile of sorted values."""
+    if len(values) < 2:  # noqa: PLR2004
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percentile - 1]
+
+
+class BridgeClient:
+    """Websocket client speaking the bridge protocol."""
+
+    def __init__(self, url: str, token: str, max_in_flight: int) -> None:
+        """Initialize the client."""
+        self._url = url
+        self._token = token
+        self._ids = itertools.count(1)
+        self._pending: dict[int, tuple[str, float]] = {}
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._session: aiohttp.ClientSession | None = None
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._reader: asyncio.Task | None = None
+        self.stats = Stats()
+
+    @property
+    def unanswered(self) -> int:
+        """Return the number of messages without a result."""
+        return len(self._pending)
+
+    async def connect(self) -> None:
+        """Connect and authenticate."""
+        self._session = aiohttp.ClientSession()
+        self._ws = await self._session.ws_connect(self._url, max_msg_size=0)
+        await self._ws.receive_json()
+        await self._ws.send_json({"type": "auth", "access_token": self._token})
+        msg = await self._ws.receive_json()
+        if msg["type"] != "auth_ok":
+            await self.close()
+            raise ConnectionRefusedError(msg.get("message", msg["type"]))
+        self._reader = asyncio.create_task(self._read())
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._reader is not None:
+            self._reader.cancel()
+        if self._ws is not None:
+            await self._ws.close()
+        if self._session is not None:
+            await self._session.close()
+
+    async def send(self, msg: dict[str, Any]) -> int:
+        """Send a message, waiting while too many are unanswered, return its id."""
+        assert self._ws is not None  # noqa: S101
+        await self._in_flight.acquire()
+        msg["id"] = next(self._ids)
+        self._pending[msg["id"]] = (msg["type"], time.perf_counter())
+        self.stats.sent[msg["type"]] += 1
+        await self._ws.send_json(msg)
+        return msg["id"]
+
+    async def drain(self, timeout: float) -> None:
+        """Wait until all messages are answered or the timeout passed."""
+        deadline = time.monotonic() + timeout
+        while self._pending and time.monotonic() < deadline:
+            await asyncio.sleep(TICK)
+
+    async def _read(self) -> None:
+        """Match results to the messages they answer."""
+        assert self._ws is not None  # noqa: S101
+        async for message in self._ws:
+            if message.type != aiohttp.WSMsgType.TEXT:
+                break
+            payload = message.json()
+            for msg in payload if isinstance(payload, list) else [payload]:
+                if msg["type"] != "result":
+                    # Switch commands, signals and subscribed events
+                    self.stats.events[msg.get("id")] += 1
+                    continue
+                if (pending := self._pending.pop(msg["id"], None)) is None:
+                    continue
+                command, sent = pending
+                self._in_flight.release()
+                if msg["success"]:
+                    self.stats.ack(command, time.perf_counter() - sent)
+                else:
+                    self.stats.error(command, msg["error"]["code"])
+
+
+def build_inventory(
+    services: int, devices: int, entities: int, mix: dict[str, int]
+) -> list[SimulatedEntity]:
+    """Return the entities of the simulated bridge, platforms spread by weight."""
+    weights = [mix.get(platform, 0) for platform in PLATFORMS]
+    platforms = random.Random(0).choices(  # noqa: S311
+        PLATFORMS, weights, k=services * devices * entities
+    )
+    slugs = itertools.product(range(services), range(devices), range(entities))
+    return [
+        SimulatedEntity(
+            f"service_{service}",
+            f"device_{service}_{device}",
+            f"entity_{entity}",
+            platform,
+        )
+        for (service, device, entity), platform in zip(slugs, platforms, strict=True)
+    ]
+
+
+def add_message(entity: SimulatedEntity, bridge_id: str) -> dict[str, Any]:
+    """Return the discovery message of an entity."""
+    return {
+        "type": "bridge/entity/add",
+        **entity.key(bridge_id),
+        "platform": entity.platform,
+        "device_info": {"name": entity.device_slug, "manufacturer": "loadgen"},
+        "config": {"name": entity.entity_slug, **PLATFORM_CONFIG[entity.platform]},
+    }
+
+
+def state_message(entity: SimulatedEntity, bridge_id: str) -> dict[str, Any]:
+    """Return a state update of an entity."""
+    if entity.platform == "sensor":
+        state: Any = round(random.uniform(15, 30), 2)  # noqa: S311
+    else:
+        state = random.random() < 0.5  # noqa: PLR2004, S311
+    return {
+        "type": "bridge/entity/state",
+        **entity.key(bridge_id),
+        "state": state,
+        "attributes": {"source": "loadgen"},
+        "sent_at": time.time(),
+    }
+
+
+def config_message(entity: SimulatedEntity, bridge_id: str) -> dict[str, Any]:
+    """Return a config update of an entity."""
+    return {
+        "type": "bridge/entity/config",
+        **entity.key(bridge_id),
+        "config": {"name": f"{entity.entity_slug} {random.randint(0, 9)}"},  # noqa: S311
+    }
+
+
+def available_message(entity: SimulatedEntity, bridge_id: str) -> dict[str, Any]:
+    """Return an availability update of an entity."""
+    return {
+        "type": "bridge/entity/available",
+        **entity.key(bridge_id),
+        "available": random.random() < 0.9,  # noqa: PLR2004, S311
+    }
+
+
+def event_message(entity: SimulatedEntity, bridge_id: str) -> dict[str, Any]:
+    """Return an event of an event entity."""
+    return {
+        "type": "bridge/entity/event",
+        **entity.key(bridge_id),
+        "event_type": random.choice(PLATFORM_CONFIG["event"]["event_types"]),  # noqa: S311
+        "sent_at": time.time(),
+    }
+
+
+async def drive(
+    client: BridgeClient,
+    rate: float,
+    count: int,
+    make_message: Callable[[], dict[str, Any]],
+) -> None:
+    """Send messages at a fixed rate, independent of how fast they are answered."""
+    if rate <= 0:
+        return
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    sent = 0
+    while sent < count:
+        due = min(count, int((loop.time() - start) * rate) + 1)
+        while sent < due:
+            await client.send(make_message())
+            sent += 1
+        await asyncio.sleep(TICK)
+
+
+def _parse_mix(value: str) -> dict[str, int]:
+    """Parse a platform mix like sensor=70,switch=30."""
+    mix = {}
+    for part in value.split(","):
+        platform, _, weight = part.partition("=")
+        if platform not in PLATFORMS:
+            msg = f"Unknown platform {platform}"
+            raise argparse.ArgumentTypeError(msg)
+        mix[platform] = int(weight)
+    return mix
+
+
+def _random_sender(
+    entities: list[SimulatedEntity],
+    bridge_id: str,
+    build: Callable[[SimulatedEntity, str], dict[str, Any]],
+) -> Callable[[], dict[str, Any]]:
+    """Return a message factory for random entities."""
+    return lambda: build(random.choice(entities), bridge_id)  # noqa: S311
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="ws://localhost:8123/api/websocket")
+    parser.add_argument("--token", default=os.environ.get("HASS_TOKEN"))
+    parser.add_argument("--bridge-id", default="default")
+    parser.add_argument("--services", type=int, default=5)
+    parser.add_argument("--devices", type=int, default=20, help="per service")
+    parser.add_argument("--entities", type=int, default=10, help="per device")
+    parser.add_argument("--mix", type=_parse_mix, default=_parse_mix(DEFAULT_MIX))
+    parser.add_argument("--add-rate", type=float, default=1000)
+    parser.add_argument("--state-rate", type=float, default=500)
+    parser.add_argument("--config-rate", type=float, default=5)
+    parser.add_argument("--available-rate", type=float, default=5)
+    parser.add_argument("--event-rate", type=float, default=20)
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--drain-timeout", type=float, default=10)
+    args = parser.parse_args()
+    if not args.token:
+        parser.error("--token or HASS_TOKEN is required")
+    return args
+
+
+async def async_main(args: argparse.Namespace) -> int:
+    """Run the load test and return the number of failed messages."""
+    inventory = build_inventory(args.services, args.devices, args.entities, args.mix)
+    stateful = [entity for entity in inventory if entity.platform in STATE_PLATFORMS]
+    events = [entity for entity in inventory if entity.platform == "event"]
+
+    client = BridgeClient(args.url, args.token, args.max_in_flight)
+    await client.connect()
+    try:
+        added = iter(inventory)
+        await drive(
+            client,
+            args.add_rate,
+            len(inventory),
+            lambda: add_message(next(added), args.bridge_id),
+        )
+        await client.drain(args.drain_timeout)
+        sys.stdout.write(f"Discovered {len(inventory)} entities\n")
+
+        start = time.perf_counter()
+        traffic = [
+            (args.config_rate, inventory, config_message),
+            (args.available_rate, inventory, available_message),
+            (args.state_rate, stateful, state_message),
+            (args.event_rate, events, event_message),
+        ]
+        await asyncio.gather(
+            *(
+                drive(
+                    client,
+                    rate,
+                    int(rate * args.duration),
+                    _random_sender(entities, args.bridge_id, build),
+                )
+                for rate, entities, build in traffic
+                if entities
+            )
+        )
+        await client.drain(args.drain_timeout)
+        elapsed = time.perf_counter() - start
+    finally:
+        await client.close()
+
+    sys.stdout.write(client.stats.report(elapsed, client.unanswered) + "\n")
+    return sum(client.stats.errors.values()) + client.unanswered
+
+
+def main() -> None:
+    """Run the load generator."""
+    sys.exit(1 if asyncio.run(async_main(parse_args())) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Replay recorded bridge traffic against a running Home Assistant instance.
+
+Reads a file written by the bridge/debug/record command and sends the
+recorded messages with their original timing, optionally sped up. Reports
+the ack latency per command, the replay throughput and the number of state
+writes it caused.
+
+Usage: python scripts/replay.py --token <long-lived token> <recording> [--speed 10]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from loadgen import BridgeClient
+
+# Fields refreshed on replay, the ids are assigned by the client
+TIMESTAMP_FIELDS = ("sent_at",)
+
+
+def read_recording(path: Path) -> list[tuple[float, dict[str, Any]]]:
+    """Return the arrival times and messages of a recording."""
+    recording = []
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            msg = entry["msg"]
+            msg.pop("id", None)
+            recording.append((entry["t"], msg))
+    return recording
+
+
+async def replay(
+    client: BridgeClient, recording: list[tuple[float, dict[str, Any]]], speed: float
+) -> None:
+    """Send the messages at their recorded offsets, divided by the speed."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    first = recording[0][0]
+    for recorded_at, msg in recording:
+        delay = start + (recorded_at - first) / speed - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        for field in TIMESTAMP_FIELDS:
+            if field in msg:
+                msg[field] = time.time()
+        await client.send(msg)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("recording", type=Path)
+    parser.add_argument("--url", default="ws://localhost:8123/api/websocket")
+    parser.add_argument("--token", default=os.environ.get("HASS_TOKEN"))
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--drain-timeout", type=float, default=10)
+    args = parser.parse_args()
+    if not args.token:
+        parser.error("--token or HASS_TOKEN is required")
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+    return args
+
+
+async def async_main(args: argparse.Namespace) -> int:
+    """Replay the recording and return the number of failed messages."""
+    recording = read_recording(args.recording)
+    if not recording:
+        sys.stdout.write("Empty recording\n")
+        return 0
+
+    client = BridgeClient(args.url, args.token, args.max_in_flight)
+    await client.connect()
+    try:
+        subscription = await client.send(
+            {"type": "subscribe_events", "event_type": "state_changed"}
+        )
+        await client.drain(args.drain_timeout)
+        del client.stats.sent["subscribe_events"]
+        client.stats.latencies.pop("subscribe_events", None)
+
+        start = time.perf_counter()
+        await replay(client, recording, args.speed)
+        await client.drain(args.drain_timeout)
+        elapsed = time.perf_counter() - start
+    finally:
+        await client.close()
+
+    sys.stdout.write(
+        f"Replayed {len(recording)} messages in {elapsed:.1f}s, "
+        f"{len(recording) / elapsed:.1f}/s, "
+        f"state writes: {client.stats.events[subscription]}\n"
+    )
+    sys.stdout.write(client.stats.report(elapsed, client.unanswered) + "\n")
+    return sum(client.stats.errors.values()) + client.unanswered
+
+
+def main() -> None:
+    """Run the replay."""
+    sys.exit(1 if asyncio.run(async_main(parse_args())) else 0)
+
+
+if __name__ == "__main__":
+    main()